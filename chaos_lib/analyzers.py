@@ -10,6 +10,12 @@ import shutil
 from tqdm import tqdm
 from thefuzz import fuzz
 
+# msgpack is optional; when installed, events are also saved in binary form
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 def scale_roi_for_resolution(roi_coords, video_width, video_height, reference_width=2560, reference_height=1440):
     """
     Scale ROI coordinates from reference resolution to actual video resolution.
@@ -196,9 +202,11 @@ def analyze_killfeed(video_path: str, config: dict, reader) -> list:
     # --- STATE MACHINE: Stores victims currently on screen to prevent duplicates ---
     active_kills = {} # Format: { "victim_name": {"first_seen": timestamp} }
     
-    # Load config parameters
-    hsv_lower1, hsv_upper1 = np.array(config['red_hsv_lower1']), np.array(config['red_hsv_upper1'])
-    hsv_lower2, hsv_upper2 = np.array(config['red_hsv_lower2']), np.array(config['red_hsv_upper2'])
+    # Load config parameters (HSV bounds as uint8 to match the HSV frame)
+    hsv_lower1 = np.array(config['red_hsv_lower1'], dtype=np.uint8)
+    hsv_upper1 = np.array(config['red_hsv_upper1'], dtype=np.uint8)
+    hsv_lower2 = np.array(config['red_hsv_lower2'], dtype=np.uint8)
+    hsv_upper2 = np.array(config['red_hsv_upper2'], dtype=np.uint8)
     min_h, max_h = config['killfeed_rect_min_height'], config['killfeed_rect_max_height']
     min_aspect_ratio = config['killfeed_rect_min_aspect_ratio']
     memory_duration = config['kill_memory_duration_seconds']
@@ -328,24 +336,8 @@ def analyze_audio(video_path: str, model, temp_dir: str) -> tuple[list, list]:
         if audio_path and os.path.exists(audio_path):
             os.remove(audio_path)
 
-def run_analysis(config: dict):
-    data_folder = config['data_folder']
-    manifest_path = os.path.join(data_folder, 'manifest.json')
-    with open(manifest_path, 'r') as f:
-        video_paths = json.load(f)
-    if config.get('debug_mode', False):
-        debug_folder = os.path.join(config['data_folder'], 'debug_screenshots')
-        if os.path.exists(debug_folder):
-            print("DEBUG: Deleting old debug screenshots...")
-            shutil.rmtree(debug_folder)
-        if not video_paths:
-            print("Debug mode enabled, but manifest is empty. Nothing to process.")
-            return
-        video_paths = video_paths[:1]
-        print(f"DEBUG: Processing a single video: {video_paths[0]}")
-    if not video_paths:
-        print("No video paths to analyze.")
-        return
+def load_models(config: dict):
+    """Build the EasyOCR reader and Whisper model; returns (ocr_reader, whisper_model)."""
     print("Initializing AI Models (EasyOCR & Whisper)...")
     import easyocr
     
@@ -369,6 +361,49 @@ def run_analysis(config: dict):
         # Windows/Linux: Use GPU acceleration normally, or CPU if disabled
         ocr_reader = easyocr.Reader(['en'], gpu=use_gpu)
     whisper_model = whisper.load_model(config['whisper_model'], device='cuda' if use_gpu else 'cpu')
+    return ocr_reader, whisper_model
+
+# Models loaded by get_models, keyed by (whisper model name, use_gpu)
+_loaded_models = {}
+
+def get_models(config: dict):
+    """Return (ocr_reader, whisper_model) for config, loading them once per process.
+    
+    Later runs in the same process (GUI pipeline runs, pool workers handling
+    several videos) reuse them. Only one set is kept loaded at a time.
+    """
+    key = (config['whisper_model'], bool(config.get('use_gpu', False)))
+    models = _loaded_models.get(key)
+    if models is None:
+        _loaded_models.clear()
+        models = _loaded_models[key] = load_models(config)
+    return models
+
+def run_analysis(config: dict, models=None, video_paths=None):
+    """Analyze every video in the manifest, or the given video_paths.
+    
+    models is an (ocr_reader, whisper_model) pair from load_models; without
+    it the process-wide models from get_models are used.
+    """
+    data_folder = config['data_folder']
+    if video_paths is None:
+        manifest_path = os.path.join(data_folder, 'manifest.json')
+        with open(manifest_path, 'r') as f:
+            video_paths = json.load(f)
+    if config.get('debug_mode', False):
+        debug_folder = os.path.join(config['data_folder'], 'debug_screenshots')
+        if os.path.exists(debug_folder):
+            print("DEBUG: Deleting old debug screenshots...")
+            shutil.rmtree(debug_folder)
+        if not video_paths:
+            print("Debug mode enabled, but manifest is empty. Nothing to process.")
+            return
+        video_paths = video_paths[:1]
+        print(f"DEBUG: Processing a single video: {video_paths[0]}")
+    if not video_paths:
+        print("No video paths to analyze.")
+        return
+    ocr_reader, whisper_model = models if models is not None else get_models(config)
     all_events = []
     progress = tqdm(video_paths, desc="Analyzing Videos")
     for video_path in progress:
@@ -384,4 +419,9 @@ def run_analysis(config: dict):
     events_path = os.path.join(data_folder, "all_events.json")
     with open(events_path, 'w') as f:
         json.dump(all_events, f, indent=2)
+    # Binary copy for faster loading when events are combined for the summary;
+    # the JSON file stays the format the correlator reads
+    if msgpack is not None:
+        with open(os.path.join(data_folder, "all_events.msgpack"), 'wb') as f:
+            msgpack.pack(all_events, f, use_bin_type=True)
     print(f"\nAll events saved to {events_path}")
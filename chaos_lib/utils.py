@@ -0,0 +1,9 @@
+import os
+from typing import Iterable
+
+def ensure_dirs(paths: Iterable[str]) -> None:
+    """Create each directory in paths that doesn't exist yet."""
+    for path in paths:
+        # One stat for the common case; makedirs walks up the parents
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
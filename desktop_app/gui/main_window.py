@@ -165,6 +165,9 @@ class ChaosMainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event."""
+        # Closing the ROI configurator stops its video decoder thread
+        self.config_tab.roi_configurator.close()
+        
         try:
             # Save current window size
             config = self.config_manager.load_config()
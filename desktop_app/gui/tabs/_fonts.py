@@ -0,0 +1,19 @@
+"""
+Shared fonts for the tab components.
+"""
+
+from functools import lru_cache
+
+from PyQt6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def title_font() -> QFont:
+    """Get the font used for tab title labels.
+
+    Built lazily on first use because tab modules are imported before the
+    QApplication exists; every tab then shares the same instance.
+    """
+    font = QFont("Arial", 16, QFont.Weight.Bold)
+    font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+    return font
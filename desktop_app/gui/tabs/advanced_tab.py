@@ -6,9 +6,9 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QSlider, QSpinBox, QDoubleSpinBox, QGroupBox,
                             QPushButton, QMessageBox, QScrollArea, QFrame)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
 
 from desktop_app.gui.utils.config_manager import ConfigManager
+from desktop_app.gui.tabs._fonts import title_font
 
 
 class AdvancedTab(QWidget):
@@ -28,7 +28,7 @@ class AdvancedTab(QWidget):
         
         # Title
         title = QLabel("🔬 Advanced Settings")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(title_font())
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -8,10 +8,14 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QLineEdit, QTextEdit, QGroupBox,
                             QFileDialog, QMessageBox, QFrame, QScrollArea)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
 
 from desktop_app.gui.utils.config_manager import ConfigManager
 from desktop_app.gui.widgets.video_roi_configurator import VideoROIConfigurator
+from desktop_app.gui.tabs._fonts import title_font
+
+# Default ROI coordinates [x1, y1, x2, y2] at the 2560x1440 reference resolution
+_DEFAULT_KILLFEED_ROI = (1920, 40, 2550, 300)
+_DEFAULT_CHAT_ROI = (30, 1150, 650, 1300)
 
 
 class ConfigTab(QWidget):
@@ -22,48 +26,55 @@ class ConfigTab(QWidget):
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
+        self._msg = QMessageBox(self)
         self.init_ui()
         self.load_config()
         
     def init_ui(self):
         """Initialize the user interface."""
-        layout = QVBoxLayout()
-        
-        # Title
-        title = QLabel("⚙️ Configuration")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
-        
-        # Create scroll area for the content
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        
-        # File paths section
-        paths_group = self.create_paths_group()
-        scroll_layout.addWidget(paths_group)
-        
-        # Player names section
-        players_group = self.create_players_group()
-        scroll_layout.addWidget(players_group)
-        
-        # ROI configuration section
-        roi_group = self.create_roi_group()
-        scroll_layout.addWidget(roi_group)
-        
-        # Action buttons
-        buttons_group = self.create_buttons_group()
-        scroll_layout.addWidget(buttons_group)
-        
-        # Add stretch to push everything to the top
-        scroll_layout.addStretch()
-        
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        layout.addWidget(scroll_area)
-        
-        self.setLayout(layout)
+        # Build the whole tab with updates disabled so Qt lays it out once
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout()
+            
+            # Title
+            title = QLabel("⚙️ Configuration")
+            title.setFont(title_font())
+            title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(title)
+            
+            # Create scroll area for the content
+            scroll_area = QScrollArea()
+            scroll_widget = QWidget()
+            scroll_layout = QVBoxLayout(scroll_widget)
+            
+            # File paths section
+            paths_group = self.create_paths_group()
+            scroll_layout.addWidget(paths_group)
+            
+            # Player names section
+            players_group = self.create_players_group()
+            scroll_layout.addWidget(players_group)
+            
+            # ROI configuration section
+            roi_group = self.create_roi_group()
+            scroll_layout.addWidget(roi_group)
+            
+            # Action buttons
+            buttons_group = self.create_buttons_group()
+            scroll_layout.addWidget(buttons_group)
+            
+            # Add stretch to push everything to the top
+            scroll_layout.addStretch()
+            
+            scroll_area.setWidget(scroll_widget)
+            scroll_area.setWidgetResizable(True)
+            layout.addWidget(scroll_area)
+            
+            self.setLayout(layout)
+            layout.activate()
+        finally:
+            self.setUpdatesEnabled(True)
         
     def create_paths_group(self):
         """Create the file paths configuration group."""
@@ -158,6 +169,14 @@ class ConfigTab(QWidget):
         group.setLayout(layout)
         return group
         
+    def _show(self, icon, title, text, buttons=QMessageBox.StandardButton.Ok):
+        """Show a message using the tab's reusable message box."""
+        self._msg.setIcon(icon)
+        self._msg.setWindowTitle(title)
+        self._msg.setText(text)
+        self._msg.setStandardButtons(buttons)
+        return QMessageBox.StandardButton(self._msg.exec())
+        
     def browse_folder(self, line_edit):
         """Open folder browser dialog."""
         current_path = line_edit.text() or str(Path.home())
@@ -185,13 +204,13 @@ class ConfigTab(QWidget):
             self.players_edit.setPlainText('\n'.join(player_names))
             
             # Load ROI settings
-            killfeed_roi = config.get('killfeed_roi', [1920, 40, 2550, 300])
-            chat_roi = config.get('chat_roi', [30, 1150, 650, 1300])
+            killfeed_roi = config.get('killfeed_roi', list(_DEFAULT_KILLFEED_ROI))
+            chat_roi = config.get('chat_roi', list(_DEFAULT_CHAT_ROI))
             self.roi_configurator.set_roi('killfeed', killfeed_roi)
             self.roi_configurator.set_roi('chat', chat_roi)
             
         except Exception as e:
-            QMessageBox.warning(self, "Configuration Error", f"Failed to load configuration: {str(e)}")
+            self._show(QMessageBox.Icon.Warning, "Configuration Error", f"Failed to load configuration: {str(e)}")
             
     def save_configuration(self):
         """Save current configuration."""
@@ -210,24 +229,24 @@ class ConfigTab(QWidget):
             # Save ROI settings
             roi_data = self.roi_configurator.get_roi_data()
             if roi_data:
-                config['killfeed_roi'] = roi_data.get('killfeed', [1920, 40, 2550, 300])
-                config['chat_roi'] = roi_data.get('chat', [30, 1150, 650, 1300])
+                config['killfeed_roi'] = roi_data.get('killfeed', list(_DEFAULT_KILLFEED_ROI))
+                config['chat_roi'] = roi_data.get('chat', list(_DEFAULT_CHAT_ROI))
             
             # Validate configuration
             errors = self.config_manager.validate_config(config)
             if errors:
-                QMessageBox.warning(self, "Configuration Errors", "Please fix the following errors:\n\n" + "\n".join(errors))
+                self._show(QMessageBox.Icon.Warning, "Configuration Errors", "Please fix the following errors:\n\n" + "\n".join(errors))
                 return
             
             # Save configuration
             if self.config_manager.save_config(config):
-                QMessageBox.information(self, "Success", "Configuration saved successfully!")
+                self._show(QMessageBox.Icon.Information, "Success", "Configuration saved successfully!")
                 self.config_changed.emit(config)
             else:
-                QMessageBox.warning(self, "Error", "Failed to save configuration.")
+                self._show(QMessageBox.Icon.Warning, "Error", "Failed to save configuration.")
                 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save configuration: {str(e)}")
+            self._show(QMessageBox.Icon.Critical, "Error", f"Failed to save configuration: {str(e)}")
             
     def test_configuration(self):
         """Test the current configuration."""
@@ -245,32 +264,32 @@ class ConfigTab(QWidget):
             
             roi_data = self.roi_configurator.get_roi_data()
             if roi_data:
-                config['killfeed_roi'] = roi_data.get('killfeed', [1920, 40, 2550, 300])
-                config['chat_roi'] = roi_data.get('chat', [30, 1150, 650, 1300])
+                config['killfeed_roi'] = roi_data.get('killfeed', list(_DEFAULT_KILLFEED_ROI))
+                config['chat_roi'] = roi_data.get('chat', list(_DEFAULT_CHAT_ROI))
             
             # Validate configuration
             errors = self.config_manager.validate_config(config)
             if errors:
-                QMessageBox.warning(self, "Configuration Errors", "Please fix the following errors:\n\n" + "\n".join(errors))
+                self._show(QMessageBox.Icon.Warning, "Configuration Errors", "Please fix the following errors:\n\n" + "\n".join(errors))
                 return
             
             # Test ROI detection if available
             if hasattr(self.roi_configurator, 'test_detection'):
                 test_results = self.roi_configurator.test_detection()
                 if test_results:
-                    QMessageBox.information(self, "Test Results", f"ROI detection test completed:\n\n{test_results}")
+                    self._show(QMessageBox.Icon.Information, "Test Results", f"ROI detection test completed:\n\n{test_results}")
                 else:
-                    QMessageBox.information(self, "Test Results", "ROI detection test completed successfully!")
+                    self._show(QMessageBox.Icon.Information, "Test Results", "ROI detection test completed successfully!")
             else:
-                QMessageBox.information(self, "Configuration Test", "Configuration is valid!")
+                self._show(QMessageBox.Icon.Information, "Configuration Test", "Configuration is valid!")
                 
         except Exception as e:
-            QMessageBox.critical(self, "Test Error", f"Failed to test configuration: {str(e)}")
+            self._show(QMessageBox.Icon.Critical, "Test Error", f"Failed to test configuration: {str(e)}")
             
     def reset_configuration(self):
         """Reset configuration to defaults."""
-        reply = QMessageBox.question(
-            self, 
+        reply = self._show(
+            QMessageBox.Icon.Question,
             "Reset Configuration", 
             "Are you sure you want to reset all settings to defaults? This cannot be undone.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
@@ -289,13 +308,13 @@ class ConfigTab(QWidget):
                 self.players_edit.setPlainText('\n'.join(player_names))
                 
                 # Reset ROI
-                self.roi_configurator.set_roi('killfeed', default_config.get('killfeed_roi', [1920, 40, 2550, 300]))
-                self.roi_configurator.set_roi('chat', default_config.get('chat_roi', [30, 1150, 650, 1300]))
+                self.roi_configurator.set_roi('killfeed', default_config.get('killfeed_roi', list(_DEFAULT_KILLFEED_ROI)))
+                self.roi_configurator.set_roi('chat', default_config.get('chat_roi', list(_DEFAULT_CHAT_ROI)))
                 
-                QMessageBox.information(self, "Reset Complete", "Configuration has been reset to defaults.")
+                self._show(QMessageBox.Icon.Information, "Reset Complete", "Configuration has been reset to defaults.")
                 
             except Exception as e:
-                QMessageBox.critical(self, "Reset Error", f"Failed to reset configuration: {str(e)}")
+                self._show(QMessageBox.Icon.Critical, "Reset Error", f"Failed to reset configuration: {str(e)}")
                 
     def on_roi_changed(self, roi_data):
         """Handle ROI changes."""
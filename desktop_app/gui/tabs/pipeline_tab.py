@@ -6,12 +6,12 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QCheckBox, QGroupBox, QSplitter,
                             QMessageBox, QFrame)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
 
 from desktop_app.gui.widgets.progress_tracker import ProgressTracker
 from desktop_app.gui.widgets.log_viewer import LogViewer
 from desktop_app.workers.pipeline_worker import PipelineWorker
 from desktop_app.gui.utils.config_manager import ConfigManager
+from desktop_app.gui.tabs._fonts import title_font
 
 
 class PipelineTab(QWidget):
@@ -27,38 +27,44 @@ class PipelineTab(QWidget):
         
     def init_ui(self):
         """Initialize the user interface."""
-        layout = QVBoxLayout()
-        
-        # Title
-        title = QLabel("🚀 Pipeline Execution")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
-        
-        # Stage selection section
-        stages_group = self.create_stages_group()
-        layout.addWidget(stages_group)
-        
-        # Control buttons section
-        controls_group = self.create_controls_group()
-        layout.addWidget(controls_group)
-        
-        # Create splitter for progress and logs
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        
-        # Progress tracker
-        self.progress_tracker = ProgressTracker()
-        splitter.addWidget(self.progress_tracker)
-        
-        # Log viewer
-        self.log_viewer = LogViewer()
-        splitter.addWidget(self.log_viewer)
-        
-        # Set splitter proportions (60% progress, 40% logs)
-        splitter.setSizes([600, 400])
-        layout.addWidget(splitter)
-        
-        self.setLayout(layout)
+        # Build the whole tab with updates disabled so Qt lays it out once
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout()
+            
+            # Title
+            title = QLabel("🚀 Pipeline Execution")
+            title.setFont(title_font())
+            title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(title)
+            
+            # Stage selection section
+            stages_group = self.create_stages_group()
+            layout.addWidget(stages_group)
+            
+            # Control buttons section
+            controls_group = self.create_controls_group()
+            layout.addWidget(controls_group)
+            
+            # Create splitter for progress and logs
+            splitter = QSplitter(Qt.Orientation.Horizontal)
+            
+            # Progress tracker
+            self.progress_tracker = ProgressTracker()
+            splitter.addWidget(self.progress_tracker)
+            
+            # Log viewer
+            self.log_viewer = LogViewer()
+            splitter.addWidget(self.log_viewer)
+            
+            # Set splitter proportions (60% progress, 40% logs)
+            splitter.setSizes([600, 400])
+            layout.addWidget(splitter)
+            
+            self.setLayout(layout)
+            layout.activate()
+        finally:
+            self.setUpdatesEnabled(True)
         
     def create_stages_group(self):
         """Create the stage selection group."""
@@ -250,8 +256,9 @@ class PipelineTab(QWidget):
         self.pipeline_worker.stage_started.connect(self.stage_started)
         self.pipeline_worker.stage_completed.connect(self.stage_completed)
         self.pipeline_worker.log_message.connect(self.add_log_message)
+        self.pipeline_worker.log_message_batch.connect(self.add_log_messages)
         self.pipeline_worker.error_occurred.connect(self.handle_error)
-        self.pipeline_worker.finished.connect(self.pipeline_finished)
+        self.pipeline_worker.finished.connect(self._on_pipeline_finished)
         
         # Update UI
         self.progress_tracker.set_stages(selected_stages)
@@ -335,12 +342,16 @@ class PipelineTab(QWidget):
         """Add message to log viewer."""
         self.log_viewer.add_message(message, level)
         
+    def add_log_messages(self, messages, level="info"):
+        """Add a batch of messages to log viewer."""
+        self.log_viewer.add_messages(messages, level)
+        
     def handle_error(self, error_message):
         """Handle pipeline error."""
         self.add_log_message(f"Error: {error_message}", "error")
         
-    def pipeline_finished(self, success):
-        """Handle pipeline completion."""
+    def _on_pipeline_finished(self, success: bool):
+        """Handle pipeline completion and re-emit pipeline_finished."""
         # Update UI
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
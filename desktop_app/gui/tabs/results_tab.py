@@ -3,16 +3,132 @@ Results tab for managing and previewing generated clips.
 """
 
 import os
+import re
 import json
+import platform
+import subprocess
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QPushButton, QListWidget, QListWidgetItem, QGroupBox,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
+                            QPushButton, QListView, QGroupBox,
                             QMessageBox, QFileDialog, QSplitter, QTextEdit)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QIcon
 
 from desktop_app.gui.utils.config_manager import ConfigManager
 from desktop_app.gui.widgets.clip_preview import ClipPreviewWidget
+from desktop_app.gui.tabs._fonts import title_font
+from desktop_app.gui.widgets.static_text_label import StaticTextLabel
+
+# orjson is optional; it parses large highlight files noticeably faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed highlights files: path -> (st_mtime_ns, st_size, clips, scores, tags_per_clip)
+_HIGHLIGHTS_CACHE = {}
+
+# Clip filenames: clip_XXXX_description_score_XX.mp4, or anything ending in _score_XX.mp4
+_CLIP_NAME_RE = re.compile(r'^clip_(\d+)_.*_score_(.+)\.mp4$')
+_SCORE_NAME_RE = re.compile(r'^.*_score_(.+)\.mp4$')
+
+# Fixed-layout headers for the details and statistics panes
+_DETAILS_TEMPLATE = (
+    "Clip Details:\n"
+    "Score: {score}\n"
+    "Start Time: {clip_start:.2f}s\n"
+    "End Time: {clip_end:.2f}s\n"
+    "Duration: {duration:.2f}s\n"
+    "Source: {source}\n"
+)
+_STATS_TEMPLATE = (
+    "Total Clips: {total_clips}\n"
+    "Total Score: {total_score}\n"
+    "Average Score: {avg_score:.1f}\n\n"
+)
+
+# Upper bound on lines kept by the read-only text panes
+_MAX_TEXT_BLOCKS = 5000
+
+
+
+def _load_json_file(path):
+    """Parse a JSON file, using orjson on the raw bytes when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _load_highlights(highlights_path):
+    """Load ordered_highlights.json, reusing the parsed list while the file is unchanged.
+    
+    Returns:
+        Tuple of (clips, scores, tags_per_clip), where scores and tags_per_clip
+        are per-clip columns extracted once so statistics don't walk the dicts.
+    """
+    st = os.stat(highlights_path)
+    cached = _HIGHLIGHTS_CACHE.get(highlights_path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2:]
+    
+    clips = _load_json_file(highlights_path)
+    scores = [clip.get('score', 0) for clip in clips]
+    tags_per_clip = [clip.get('tags') or [] for clip in clips]
+    _HIGHLIGHTS_CACHE[highlights_path] = (st.st_mtime_ns, st.st_size, clips, scores, tags_per_clip)
+    return clips, scores, tags_per_clip
+
+
+class ClipsListModel(QAbstractListModel):
+    """List model over the highlights list.
+    
+    Row text is formatted on demand for the rows the view asks for, so no
+    per-clip item objects are created up front.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._clips = []
+        self._scores = []
+        self._tags_per_clip = []
+        
+    def set_clips(self, clips, scores, tags_per_clip):
+        """Replace the clips shown by the model, along with their score and tag columns."""
+        self.beginResetModel()
+        self._clips = clips
+        self._scores = scores
+        self._tags_per_clip = tags_per_clip
+        self.endResetModel()
+        
+    def clip(self, row):
+        """Get the highlight entry for a row."""
+        return self._clips[row]
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of clips."""
+        if parent.isValid():
+            return 0
+        return len(self._clips)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get the row text, or the highlight entry for UserRole."""
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            item_text = f"Clip {row+1:04d} - Score: {self._scores[row]}"
+            tags = self._tags_per_clip[row]
+            if tags:
+                item_text += f" - Tags: {', '.join(tags)}"
+            return item_text
+        if role == Qt.ItemDataRole.UserRole:
+            return self._clips[row]
+        return None
 
 
 class ResultsTab(QWidget):
@@ -21,7 +137,16 @@ class ResultsTab(QWidget):
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
+        self._config_cache = None  # (config file st_mtime_ns, config)
         self.clips_data = []
+        self._clip_index_by_idx = {}  # (zero-padded index, score text) -> path
+        self._clip_index_by_score = {}  # score text -> [paths]
+        self._clips_dir = None  # (config, Path of its final_clips_folder)
+        self._clip_index_folder = None
+        self._clip_index_mtime = None  # clips folder st_mtime_ns at last scan
+        self._stats_cache = None  # (clips_data, stats text)
+        self._sel_timer = None
+        self._shown_text = {}  # QTextEdit -> text last set on it
         self.init_ui()
         self.load_results()
         
@@ -30,8 +155,8 @@ class ResultsTab(QWidget):
         layout = QVBoxLayout()
         
         # Title
-        title = QLabel("📊 Results & Clips")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title = StaticTextLabel("📊 Results & Clips")
+        title.setFont(title_font())
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -52,7 +177,7 @@ class ResultsTab(QWidget):
         
         controls_layout.addStretch()
         
-        self.clip_count_label = QLabel("No clips found")
+        self.clip_count_label = StaticTextLabel("No clips found")
         controls_layout.addWidget(self.clip_count_label)
         
         layout.addLayout(controls_layout)
@@ -68,8 +193,13 @@ class ResultsTab(QWidget):
         clips_group = QGroupBox("Generated Clips")
         clips_layout = QVBoxLayout()
         
-        self.clips_list = QListWidget()
-        self.clips_list.itemSelectionChanged.connect(self.on_clip_selected)
+        self.clips_model = ClipsListModel(parent=self)
+        self.clips_list = QListView()
+        self.clips_list.setObjectName("clipsList")
+        self.clips_list.setUniformItemSizes(True)
+        self.clips_list.setModel(self.clips_model)
+        self.clips_list.selectionModel().currentChanged.connect(
+            lambda current, previous: self._schedule_selection())
         clips_layout.addWidget(self.clips_list)
         
         clips_group.setLayout(clips_layout)
@@ -82,6 +212,7 @@ class ResultsTab(QWidget):
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
         self.details_text.setMaximumHeight(200)
+        self.details_text.document().setMaximumBlockCount(_MAX_TEXT_BLOCKS)
         details_layout.addWidget(self.details_text)
         
         details_group.setLayout(details_layout)
@@ -110,6 +241,7 @@ class ResultsTab(QWidget):
         self.stats_text = QTextEdit()
         self.stats_text.setReadOnly(True)
         self.stats_text.setMaximumHeight(150)
+        self.stats_text.document().setMaximumBlockCount(_MAX_TEXT_BLOCKS)
         stats_layout.addWidget(self.stats_text)
         
         stats_group.setLayout(stats_layout)
@@ -117,23 +249,41 @@ class ResultsTab(QWidget):
         
         self.setLayout(layout)
         
+    def _cached_config(self):
+        """Get the configuration, reloading it only when the config file changes."""
+        try:
+            mtime = self.config_manager.config_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if self._config_cache is None or self._config_cache[0] != mtime:
+            self._config_cache = (mtime, self.config_manager.load_config())
+        return self._config_cache[1]
+        
+    def _clips_path(self):
+        """Get the final clips folder as a Path, rebuilt only when the config changes."""
+        config = self._cached_config()
+        if self._clips_dir is None or self._clips_dir[0] is not config:
+            self._clips_dir = (config, Path(config.get('final_clips_folder', './final_clips')))
+        return self._clips_dir[1]
+        
     def load_results(self):
         """Load results from the highlights file and clips folder."""
         try:
-            config = self.config_manager.load_config()
+            config = self._cached_config()
             data_folder = config.get('data_folder', './data')
-            clips_folder = config.get('final_clips_folder', './final_clips')
+            clips_folder = str(self._clips_path())
             
             # Load highlights data
             highlights_path = os.path.join(data_folder, 'ordered_highlights.json')
             if os.path.exists(highlights_path):
-                with open(highlights_path, 'r') as f:
-                    self.clips_data = json.load(f)
+                self.clips_data, self._scores, self._tags_per_clip = _load_highlights(highlights_path)
             else:
-                self.clips_data = []
+                self.clips_data, self._scores, self._tags_per_clip = [], [], []
             
             # Update clips list
             self.update_clips_list()
+            self._rebuild_clip_index(clips_folder)
             
             # Update statistics
             self.update_statistics()
@@ -141,114 +291,167 @@ class ResultsTab(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "Load Error", f"Failed to load results: {str(e)}")
             
+    def _rebuild_clip_index(self, clips_folder):
+        """Index the clip files in clips_folder with a single directory scan."""
+        self._clip_index_by_idx = {}
+        self._clip_index_by_score = {}
+        self._clip_index_folder = clips_folder
+        self._clip_index_mtime = self._folder_mtime(clips_folder)
+        
+        try:
+            entries = sorted(os.scandir(clips_folder), key=lambda entry: entry.name)
+        except OSError:
+            return
+        
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            match = _CLIP_NAME_RE.match(entry.name)
+            if match:
+                self._clip_index_by_idx.setdefault(match.groups(), entry.path)
+            match = _SCORE_NAME_RE.match(entry.name)
+            if match:
+                self._clip_index_by_score.setdefault(match.group(1), []).append(entry.path)
+            
+    @staticmethod
+    def _folder_mtime(folder):
+        """Get a folder's st_mtime_ns, or None if it cannot be read."""
+        try:
+            return os.stat(folder).st_mtime_ns
+        except OSError:
+            return None
+        
+    def _refresh_clip_index(self):
+        """Rescan the clips folder if files were added or removed since the last scan."""
+        if self._clip_index_folder is None:
+            return
+        if self._folder_mtime(self._clip_index_folder) != self._clip_index_mtime:
+            self._rebuild_clip_index(self._clip_index_folder)
+            
     def update_clips_list(self):
         """Update the clips list widget."""
-        self.clips_list.clear()
+        # The model formats rows on demand, so this is a single reset
+        self.clips_model.set_clips(self.clips_data, self._scores, self._tags_per_clip)
+        
+        # Resetting the model drops the current row without a currentChanged
+        self.on_clip_selected()
         
         if not self.clips_data:
             self.clip_count_label.setText("No clips found")
             return
         
-        for i, clip in enumerate(self.clips_data):
-            # Create list item
-            item_text = f"Clip {i+1:04d} - Score: {clip.get('score', 0)}"
-            if 'tags' in clip and clip['tags']:
-                item_text += f" - Tags: {', '.join(clip['tags'])}"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, clip)
-            self.clips_list.addItem(item)
-        
         self.clip_count_label.setText(f"{len(self.clips_data)} clips found")
         
+    def _set_plain_text(self, edit, text):
+        """Set the text of a read-only pane, skipping the relayout if unchanged."""
+        if self._shown_text.get(edit) == text:
+            return
+        self._shown_text[edit] = text
+        edit.setPlainText(text)
+        
     def update_statistics(self):
         """Update the statistics display."""
         if not self.clips_data:
-            self.stats_text.setPlainText("No data available")
+            self._set_plain_text(self.stats_text, "No data available")
             return
         
-        # Calculate statistics
-        total_clips = len(self.clips_data)
-        total_score = sum(clip.get('score', 0) for clip in self.clips_data)
-        avg_score = total_score / total_clips if total_clips > 0 else 0
+        # Reuse the text while clips_data is the same list (the highlights cache
+        # hands back the same object until the file changes)
+        if self._stats_cache is not None and self._stats_cache[0] is self.clips_data:
+            self._set_plain_text(self.stats_text, self._stats_cache[1])
+            return
         
-        # Count tags
-        tag_counts = {}
-        for clip in self.clips_data:
-            for tag in clip.get('tags', []):
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        # Calculate statistics from the score and tag columns
+        total_clips = len(self._scores)
+        total_score = sum(self._scores)
+        tag_counts = Counter(chain.from_iterable(self._tags_per_clip))
+        avg_score = total_score / total_clips if total_clips > 0 else 0
         
         # Build statistics text
-        stats_text = f"Total Clips: {total_clips}\n"
-        stats_text += f"Total Score: {total_score}\n"
-        stats_text += f"Average Score: {avg_score:.1f}\n\n"
+        parts = [_STATS_TEMPLATE.format(
+            total_clips=total_clips,
+            total_score=total_score,
+            avg_score=avg_score,
+        )]
         
         if tag_counts:
-            stats_text += "Tag Distribution:\n"
-            for tag, count in sorted(tag_counts.items(), key=lambda x: x[1], reverse=True):
-                stats_text += f"  {tag}: {count}\n"
-        
-        self.stats_text.setPlainText(stats_text)
+            parts.append("Tag Distribution:\n")
+            parts.extend(f"  {tag}: {count}\n" for tag, count in tag_counts.most_common())
+        
+        stats_text = "".join(parts)
+        self._stats_cache = (self.clips_data, stats_text)
+        self._set_plain_text(self.stats_text, stats_text)
+        
+    def _schedule_selection(self):
+        """Coalesce rapid selection changes (e.g. arrowing through the list)
+        so only the final selection is formatted and previewed."""
+        if self._sel_timer is None:
+            self._sel_timer = QTimer(self)
+            self._sel_timer.setSingleShot(True)
+            self._sel_timer.timeout.connect(self.on_clip_selected)
+        self._sel_timer.start(120)
         
     def on_clip_selected(self):
         """Handle clip selection."""
-        current_item = self.clips_list.currentItem()
-        if not current_item:
-            self.details_text.clear()
+        current = self.clips_list.currentIndex()
+        if not current.isValid():
+            self._set_plain_text(self.details_text, "")
             self.clip_preview.clear()
             return
         
-        clip_data = current_item.data(Qt.ItemDataRole.UserRole)
+        clip_data = self.clips_model.clip(current.row())
+        clip_index = current.row() + 1
         
         # Format clip details
-        details = f"Clip Details:\n"
-        details += f"Score: {clip_data.get('score', 0)}\n"
-        details += f"Start Time: {clip_data.get('clip_start', 0):.2f}s\n"
-        details += f"End Time: {clip_data.get('clip_end', 0):.2f}s\n"
-        details += f"Duration: {clip_data.get('clip_end', 0) - clip_data.get('clip_start', 0):.2f}s\n"
-        details += f"Source: {os.path.basename(clip_data.get('source_video', 'Unknown'))}\n"
+        clip_start = clip_data.get('clip_start', 0)
+        clip_end = clip_data.get('clip_end', 0)
+        parts = [_DETAILS_TEMPLATE.format(
+            score=clip_data.get('score', 0),
+            clip_start=clip_start,
+            clip_end=clip_end,
+            duration=clip_end - clip_start,
+            source=os.path.basename(clip_data.get('source_video', 'Unknown')),
+        )]
         
         if 'tags' in clip_data and clip_data['tags']:
-            details += f"Tags: {', '.join(clip_data['tags'])}\n"
+            parts.append(f"Tags: {', '.join(clip_data['tags'])}\n")
         
         if 'events_in_window' in clip_data:
             events = clip_data['events_in_window']
-            details += f"\nEvents in Window ({len(events)}):\n"
-            for event in events[:5]:  # Show first 5 events
-                details += f"  - {event.get('type', 'unknown')} at {event.get('timestamp_seconds', 0):.2f}s\n"
+            parts.append(f"\nEvents in Window ({len(events)}):\n")
+            parts.extend(  # Show first 5 events
+                f"  - {event.get('type', 'unknown')} at {event.get('timestamp_seconds', 0):.2f}s\n"
+                for event in events[:5]
+            )
             if len(events) > 5:
-                details += f"  ... and {len(events) - 5} more events\n"
+                parts.append(f"  ... and {len(events) - 5} more events\n")
         
-        self.details_text.setPlainText(details)
+        self._set_plain_text(self.details_text, "".join(parts))
         
         # Try to load the corresponding video clip
-        self.load_clip_for_preview(clip_data)
+        self.load_clip_for_preview(clip_data, clip_index)
         
-    def load_clip_for_preview(self, clip_data):
-        """Load the corresponding video clip for preview."""
+    def load_clip_for_preview(self, clip_data, clip_index):
+        """Load the corresponding video clip for preview.
+        
+        Args:
+            clip_data: Highlight entry for the clip.
+            clip_index: 1-based position of the clip in the highlights list.
+        """
         try:
-            config = self.config_manager.load_config()
-            clips_folder = config.get('final_clips_folder', './final_clips')
-            
-            # Try to find the clip file
+            # Try to find the clip file (indexed by _rebuild_clip_index on load)
             # The clip filename format is typically: clip_XXXX_description_score_XX.mp4
-            clip_index = self.clips_data.index(clip_data) + 1
+            self._refresh_clip_index()
             score = clip_data.get('score', 0)
             
-            # Look for files matching the pattern
-            import glob
-            pattern = os.path.join(clips_folder, f"clip_{clip_index:04d}_*_score_{score}.mp4")
-            matching_files = glob.glob(pattern)
-            
-            if matching_files:
-                clip_path = matching_files[0]
-                if self.clip_preview.load_clip(clip_path):
-                    return True
+            # Look up the exact clip file in the index
+            score_text = str(score)
+            clip_path = self._clip_index_by_idx.get((f"{clip_index:04d}", score_text))
+            if clip_path and self.clip_preview.load_clip(clip_path):
+                return True
             
             # If no exact match, try to find any clip file with the score
-            pattern = os.path.join(clips_folder, f"*_score_{score}.mp4")
-            matching_files = glob.glob(pattern)
-            
+            matching_files = self._clip_index_by_score.get(score_text)
             if matching_files:
                 clip_path = matching_files[0]
                 if self.clip_preview.load_clip(clip_path):
@@ -264,8 +467,7 @@ class ResultsTab(QWidget):
         
     def export_selected(self):
         """Export selected clips."""
-        current_item = self.clips_list.currentItem()
-        if not current_item:
+        if not self.clips_list.currentIndex().isValid():
             QMessageBox.information(self, "No Selection", "Please select a clip to export.")
             return
         
@@ -275,13 +477,10 @@ class ResultsTab(QWidget):
     def open_clips_folder(self):
         """Open the clips folder in the system file manager."""
         try:
-            config = self.config_manager.load_config()
-            clips_folder = config.get('final_clips_folder', './final_clips')
+            clips_dir = self._clips_path()
+            clips_folder = str(clips_dir)
             
-            if os.path.exists(clips_folder):
-                import subprocess
-                import platform
-                
+            if clips_dir.is_dir():
                 system = platform.system()
                 if system == "Darwin":  # macOS
                     subprocess.run(["open", clips_folder])
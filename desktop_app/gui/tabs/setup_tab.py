@@ -2,17 +2,73 @@
 Setup tab for system configuration and dependency installation.
 """
 
+import json
+import os
+import platform
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QProgressBar, QTextEdit, QGroupBox,
                             QMessageBox, QCheckBox, QFrame)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPixmap, QIcon
+from PyQt6.QtGui import QPixmap, QIcon, QTextCursor
 
 from desktop_app.gui.utils.system_detector import SystemDetector
 from desktop_app.gui.utils.config_manager import ConfigManager
+from desktop_app.gui.tabs._fonts import title_font
+from desktop_app.gui.widgets.static_text_label import StaticTextLabel
+
+# System probe results are reused across launches for up to an hour
+_SYSINFO_CACHE_PATH = Path.home() / '.chaos-sysinfo.json'
+_SYSINFO_MAX_AGE = 3600
+
+
+def _sysinfo_key() -> list:
+    """Identify the environment the cached probe results belong to."""
+    ffmpeg_path = shutil.which('ffmpeg')
+    try:
+        ffmpeg_mtime = os.stat(ffmpeg_path).st_mtime if ffmpeg_path else None
+    except OSError:
+        ffmpeg_mtime = None
+    return [platform.platform(), sys.executable, ffmpeg_mtime]
+
+
+def _load_cached_sysinfo(key: list):
+    """Load cached probe results, or None if missing, stale or for another environment."""
+    try:
+        with open(_SYSINFO_CACHE_PATH, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get('key') != key:
+        return None
+    if time.time() - cached.get('time', 0) > _SYSINFO_MAX_AGE:
+        return None
+    return cached.get('results')
+
+
+def _save_cached_sysinfo(key: list, results: dict):
+    """Write probe results to the cache file."""
+    try:
+        with open(_SYSINFO_CACHE_PATH, 'w') as f:
+            json.dump({'key': key, 'time': time.time(), 'results': results}, f)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error caching system info: {e}")
+
+
+def _clear_cached_sysinfo():
+    """Remove the cached probe results so the next probe runs fresh."""
+    try:
+        _SYSINFO_CACHE_PATH.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Error clearing system info cache: {e}")
 
 
 class SetupWorker(QThread):
@@ -31,37 +87,43 @@ class SetupWorker(QThread):
     def run(self):
         """Run the setup process."""
         try:
+            # Checks with recent cached results are not run again; the
+            # install steps below always run when needed
+            cached = _load_cached_sysinfo(_sysinfo_key()) or {}
+            
             success = True
             
             # Step 1: Check Python version
             self.progress_updated.emit(10, "Checking Python version...")
-            python_ok, python_version = SystemDetector.check_python_version()
+            python_ok, python_version = self._check(cached, 'python', SystemDetector.check_python_version)
             self.step_completed.emit("Python Version", python_ok)
             if not python_ok:
                 success = False
             
             # Step 2: Check FFmpeg
             self.progress_updated.emit(20, "Checking FFmpeg...")
-            ffmpeg_ok, ffmpeg_info = SystemDetector.check_ffmpeg()
+            ffmpeg_ok, ffmpeg_info = self._check(cached, 'ffmpeg', SystemDetector.check_ffmpeg)
             self.step_completed.emit("FFmpeg", ffmpeg_ok)
             
             # Step 3: Install FFmpeg if needed
             if not ffmpeg_ok and self.install_ffmpeg:
                 self.progress_updated.emit(30, "Installing FFmpeg...")
                 ffmpeg_install_ok, ffmpeg_msg = SystemDetector.install_ffmpeg()
+                SystemDetector.clear_cache()
+                _clear_cached_sysinfo()
                 self.step_completed.emit("FFmpeg Installation", ffmpeg_install_ok)
                 if ffmpeg_install_ok:
                     ffmpeg_ok = True
             
             # Step 4: Check CUDA
             self.progress_updated.emit(40, "Detecting CUDA...")
-            cuda_info = SystemDetector.detect_cuda()
+            cuda_info = self._check(cached, 'cuda', SystemDetector.detect_cuda)
             cuda_ok = cuda_info['available']
             self.step_completed.emit("CUDA", cuda_ok)
             
             # Step 5: Check dependencies
             self.progress_updated.emit(50, "Checking dependencies...")
-            dependencies = SystemDetector.check_dependencies()
+            dependencies = self._check(cached, 'dependencies', SystemDetector.check_dependencies)
             missing_deps = [dep for dep, installed in dependencies.items() if not installed]
             deps_ok = len(missing_deps) == 0
             self.step_completed.emit("Dependencies", deps_ok)
@@ -70,6 +132,8 @@ class SetupWorker(QThread):
             if not deps_ok and self.install_dependencies:
                 self.progress_updated.emit(60, "Installing dependencies...")
                 deps_install_ok = self._install_dependencies()
+                SystemDetector.clear_cache()
+                _clear_cached_sysinfo()
                 self.step_completed.emit("Dependency Installation", deps_install_ok)
                 if deps_install_ok:
                     deps_ok = True
@@ -89,23 +153,23 @@ class SetupWorker(QThread):
             self.progress_updated.emit(0, f"Setup failed: {str(e)}")
             self.finished.emit(False)
     
+    @staticmethod
+    def _check(cached: dict, name: str, probe):
+        """Return the cached result of a system probe, or run the probe."""
+        if name in cached:
+            return cached[name]
+        return probe()
+    
     def _install_dependencies(self) -> bool:
         """Install missing dependencies."""
         try:
-            # Install PyQt6 first
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", 
-                "PyQt6>=6.5.0", "PyQt6-tools>=6.5.0"
-            ], capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                return False
-            
-            # Install other dependencies
+            # Install everything in one pip run so pip starts and resolves once
             result = subprocess.run([
-                sys.executable, "-m", "pip", "install", 
+                sys.executable, "-m", "pip", "install",
+                "--no-input", "--disable-pip-version-check", "-q",
+                "PyQt6>=6.5.0", "PyQt6-tools>=6.5.0",
                 "Pillow>=10.0.0", "psutil>=5.9.0"
-            ], capture_output=True, text=True, timeout=300)
+            ], capture_output=True, text=True, timeout=600)
             
             return result.returncode == 0
             
@@ -137,12 +201,53 @@ class SetupWorker(QThread):
             print(f"Error updating config: {e}")
 
 
+class SystemProbeWorker(QThread):
+    """Worker thread that runs the SystemDetector checks concurrently."""
+    
+    results_ready = pyqtSignal(dict)  # probe name -> result
+    probe_failed = pyqtSignal(str)  # error message
+    
+    # The checks are independent and mostly wait on subprocesses or imports
+    PROBES = {
+        'python': SystemDetector.check_python_version,
+        'ffmpeg': SystemDetector.check_ffmpeg,
+        'cuda': SystemDetector.detect_cuda,
+        'dependencies': SystemDetector.check_dependencies,
+        'system_info': SystemDetector.get_system_info,
+        'disk': SystemDetector.check_disk_space,
+    }
+    
+    def __init__(self, force=False):
+        super().__init__()
+        self.force = force
+        
+    def run(self):
+        """Run every probe and emit the combined results."""
+        try:
+            key = _sysinfo_key()
+            if not self.force:
+                results = _load_cached_sysinfo(key)
+                if results is not None:
+                    self.results_ready.emit(results)
+                    return
+            
+            with ThreadPoolExecutor(max_workers=len(self.PROBES)) as executor:
+                futures = {name: executor.submit(probe) for name, probe in self.PROBES.items()}
+                results = {name: future.result() for name, future in futures.items()}
+            _save_cached_sysinfo(key, results)
+            self.results_ready.emit(results)
+        except Exception as e:
+            self.probe_failed.emit(str(e))
+
+
 class SetupTab(QWidget):
     """Setup tab for system configuration."""
     
     def __init__(self):
         super().__init__()
         self.setup_worker = None
+        self.probe_worker = None
+        self._announce_check = False
         self.init_ui()
         
     def init_ui(self):
@@ -150,8 +255,8 @@ class SetupTab(QWidget):
         layout = QVBoxLayout()
         
         # Title
-        title = QLabel("🔧 System Setup")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title = StaticTextLabel("🔧 System Setup")
+        title.setFont(title_font())
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -168,6 +273,8 @@ class SetupTab(QWidget):
         self.requirements_list = QTextEdit()
         self.requirements_list.setMaximumHeight(200)
         self.requirements_list.setReadOnly(True)
+        self.requirements_list.setPlaceholderText("Checking system...")
+        self.requirements_list.document().setMaximumBlockCount(5000)
         req_layout.addWidget(self.requirements_list)
         
         req_group.setLayout(req_layout)
@@ -214,7 +321,8 @@ class SetupTab(QWidget):
         button_layout.addWidget(self.check_btn)
         
         self.refresh_btn = QPushButton("🔄 Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_requirements)
+        self.refresh_btn.setToolTip("Re-run all system checks, ignoring cached results")
+        self.refresh_btn.clicked.connect(lambda: self.refresh_requirements(force=True))
         button_layout.addWidget(self.refresh_btn)
         
         layout.addLayout(button_layout)
@@ -227,16 +335,40 @@ class SetupTab(QWidget):
         # Initial system check
         self.refresh_requirements()
         
-    def refresh_requirements(self):
-        """Refresh the system requirements display."""
+    def refresh_requirements(self, force=False):
+        """Refresh the system requirements display.
+        
+        The checks run on a SystemProbeWorker; the display is updated when
+        its results arrive.
+        
+        Args:
+            force: Discard cached probe results and re-run every check.
+        """
+        if self.probe_worker and self.probe_worker.isRunning():
+            return
+        
+        self.refresh_btn.setEnabled(False)
+        self.check_btn.setEnabled(False)
+        
+        if force:
+            _clear_cached_sysinfo()
+            SystemDetector.clear_cache()
+        
+        self.probe_worker = SystemProbeWorker(force=force)
+        self.probe_worker.results_ready.connect(self.show_requirements)
+        self.probe_worker.probe_failed.connect(self.show_probe_error)
+        self.probe_worker.finished.connect(self.probe_finished)
+        self.probe_worker.start()
+        
+    def show_requirements(self, results: dict):
+        """Display the results of a system probe."""
         try:
-            # Get system info
-            python_ok, python_version = SystemDetector.check_python_version()
-            ffmpeg_ok, ffmpeg_info = SystemDetector.check_ffmpeg()
-            cuda_info = SystemDetector.detect_cuda()
-            dependencies = SystemDetector.check_dependencies()
-            system_info = SystemDetector.get_system_info()
-            disk_info = SystemDetector.check_disk_space()
+            python_ok, python_version = results['python']
+            ffmpeg_ok, ffmpeg_info = results['ffmpeg']
+            cuda_info = results['cuda']
+            dependencies = results['dependencies']
+            system_info = results['system_info']
+            disk_info = results['disk']
             
             # Build requirements text
             requirements_text = []
@@ -272,12 +404,25 @@ class SetupTab(QWidget):
             self.requirements_list.setPlainText("\n".join(requirements_text))
             
         except Exception as e:
-            self.requirements_list.setPlainText(f"Error checking system: {str(e)}")
+            self.show_probe_error(str(e))
+            
+    def show_probe_error(self, message: str):
+        """Display a failed system probe."""
+        self.requirements_list.setPlainText(f"Error checking system: {message}")
+        
+    def probe_finished(self):
+        """Re-enable the check buttons once a probe ends."""
+        self.refresh_btn.setEnabled(True)
+        self.check_btn.setEnabled(True)
+        
+        if self._announce_check:
+            self._announce_check = False
+            QMessageBox.information(self, "System Check", "System check completed. See requirements above.")
     
     def check_system(self):
         """Perform a quick system check."""
+        self._announce_check = True
         self.refresh_requirements()
-        QMessageBox.information(self, "System Check", "System check completed. See requirements above.")
     
     def start_setup(self):
         """Start the setup process."""
@@ -310,16 +455,19 @@ class SetupTab(QWidget):
     def step_completed(self, step_name: str, success: bool):
         """Handle step completion."""
         status = "✅" if success else "❌"
-        current_text = self.requirements_list.toPlainText()
-        
-        # Update the requirements display with step results
-        if f"{step_name}:" in current_text:
-            lines = current_text.split('\n')
-            for i, line in enumerate(lines):
-                if step_name in line and ":" in line:
-                    lines[i] = f"{step_name}: {status}"
-                    break
-            self.requirements_list.setPlainText('\n'.join(lines))
+        
+        # Update the matching line of the requirements display in place
+        # rather than rewriting the whole document
+        block = self.requirements_list.document().begin()
+        while block.isValid():
+            line = block.text()
+            if step_name in line and ":" in line:
+                cursor = QTextCursor(block)
+                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock,
+                                    QTextCursor.MoveMode.KeepAnchor)
+                cursor.insertText(f"{step_name}: {status}")
+                break
+            block = block.next()
     
     def setup_finished(self, success: bool):
         """Handle setup completion."""
@@ -341,5 +489,5 @@ class SetupTab(QWidget):
                 "Setup failed. Please check the system requirements and try again."
             )
         
-        # Refresh requirements to show final state
-        self.refresh_requirements()
+        # Refresh requirements to show final state (setup may have installed things)
+        self.refresh_requirements(force=True)
@@ -7,10 +7,124 @@ import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Prefer the libyaml-backed loader/dumper, falling back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+# Built once at import; treat as read-only and _clone before handing out
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    # File paths
+    "captures_folder": "",
+    "data_folder": "./data",
+    "final_clips_folder": "./final_clips",
+    
+    # Analysis parameters
+    "player_names": [],
+    "killfeed_roi": [1920, 40, 2550, 300],
+    "chat_roi": [30, 1150, 650, 1300],
+    
+    # Kill detection tuning
+    "red_hsv_lower1": [0, 120, 70],
+    "red_hsv_upper1": [10, 255, 255],
+    "red_hsv_lower2": [170, 120, 70],
+    "red_hsv_upper2": [180, 255, 255],
+    
+    # Color ranges for parsing names
+    "t_orange_hsv_lower": [10, 150, 150],
+    "t_orange_hsv_upper": [25, 255, 255],
+    "ct_blue_hsv_lower": [100, 150, 150],
+    "ct_blue_hsv_upper": [130, 255, 255],
+    
+    # Shape detection
+    "killfeed_rect_min_height": 25,
+    "killfeed_rect_max_height": 50,
+    "killfeed_rect_min_aspect_ratio": 8.0,
+    
+    # Deduplication
+    "kill_memory_duration_seconds": 7.0,
+    
+    # General analysis
+    "ocr_frame_step": 30,
+    "whisper_model": "base",
+    
+    # Correlation & scoring
+    "clip_pre_buffer_seconds": 7,
+    "clip_post_buffer_seconds": 8,
+    "scoring_weights": {
+        "kill": 10,
+        "multi_kill_bonus": 15,
+        "team_hype_voice": 20,
+        "enemy_rage_chat": 25,
+        "audio_spike": 5
+    },
+    
+    # GUI-specific settings
+    "gui": {
+        "window_size": [1200, 800],
+        "theme": "default",
+        "auto_save": True,
+        "auto_detect_newest_video": False
+    },
+    
+    # System settings
+    "system": {
+        "cuda_available": False,
+        "pytorch_version": "cpu",
+        "ffmpeg_path": "ffmpeg",
+        "ffmpeg_available": False,
+        "dependencies_installed": False
+    },
+    
+    # ROI configuration
+    "roi": {
+        "killfeed": [1920, 40, 2550, 300],
+        "chat": [30, 1150, 650, 1300],
+        "video_source": "auto"
+    },
+    
+    # Pipeline settings
+    "pipeline": {
+        "auto_start": False,
+        "show_logs": True,
+        "save_debug": False
+    }
+}
+
+
+
+def _clone(value: Any) -> Any:
+    """Deep-copy plain config data (dicts, lists and scalars).
+    
+    Much cheaper than copy.deepcopy for this shape of data since there is no
+    memo bookkeeping or dispatch on arbitrary types.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone(item) for item in value]
+    return value
+
 
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
     
+    # Validation schema: (key, label) pairs and required weight names, in the
+    # order errors are reported
+    _REQUIRED_PATHS = (
+        ('captures_folder', "Captures folder"),
+        ('data_folder', "Data folder"),
+        ('final_clips_folder', "Final clips folder"),
+    )
+    _ROI_KEYS = (
+        ('killfeed_roi', "Killfeed"),
+        ('chat_roi', "Chat"),
+    )
+    _REQUIRED_WEIGHTS = ('kill', 'multi_kill_bonus', 'team_hype_voice', 'enemy_rage_chat', 'audio_spike')
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the configuration manager.
         
@@ -23,90 +137,18 @@ class ConfigManager:
             config_path = project_root / "config.yaml"
         
         self.config_path = Path(config_path)
-        self.default_config = self._get_default_config()
+        self.default_config = _clone(_DEFAULT_CONFIG)  # Per-instance copy; callers may edit it
+        self._validate_cache: Dict[tuple, List[str]] = {}
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[tuple] = None
+        self._last_write: Optional[tuple] = None  # (st_mtime_ns, st_size, bytes written)
         
-    def _get_default_config(self) -> Dict[str, Any]:
-        """Get the default configuration."""
-        return {
-            # File paths
-            "captures_folder": "",
-            "data_folder": "./data",
-            "final_clips_folder": "./final_clips",
-            
-            # Analysis parameters
-            "player_names": [],
-            "killfeed_roi": [1920, 40, 2550, 300],
-            "chat_roi": [30, 1150, 650, 1300],
-            
-            # Kill detection tuning
-            "red_hsv_lower1": [0, 120, 70],
-            "red_hsv_upper1": [10, 255, 255],
-            "red_hsv_lower2": [170, 120, 70],
-            "red_hsv_upper2": [180, 255, 255],
-            
-            # Color ranges for parsing names
-            "t_orange_hsv_lower": [10, 150, 150],
-            "t_orange_hsv_upper": [25, 255, 255],
-            "ct_blue_hsv_lower": [100, 150, 150],
-            "ct_blue_hsv_upper": [130, 255, 255],
-            
-            # Shape detection
-            "killfeed_rect_min_height": 25,
-            "killfeed_rect_max_height": 50,
-            "killfeed_rect_min_aspect_ratio": 8.0,
-            
-            # Deduplication
-            "kill_memory_duration_seconds": 7.0,
-            
-            # General analysis
-            "ocr_frame_step": 30,
-            "whisper_model": "base",
-            
-            # Correlation & scoring
-            "clip_pre_buffer_seconds": 7,
-            "clip_post_buffer_seconds": 8,
-            "scoring_weights": {
-                "kill": 10,
-                "multi_kill_bonus": 15,
-                "team_hype_voice": 20,
-                "enemy_rage_chat": 25,
-                "audio_spike": 5
-            },
-            
-            # GUI-specific settings
-            "gui": {
-                "window_size": [1200, 800],
-                "theme": "default",
-                "auto_save": True
-            },
-            
-            # System settings
-            "system": {
-                "cuda_available": False,
-                "pytorch_version": "cpu",
-                "ffmpeg_path": "ffmpeg",
-                "ffmpeg_available": False,
-                "dependencies_installed": False
-            },
-            
-            # ROI configuration
-            "roi": {
-                "killfeed": [1920, 40, 2550, 300],
-                "chat": [30, 1150, 650, 1300],
-                "video_source": "auto"
-            },
-            
-            # Pipeline settings
-            "pipeline": {
-                "auto_start": False,
-                "show_logs": True,
-                "save_debug": False
-            }
-        }
-    
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file.
         
+        The parsed file is cached until its mtime or size changes; each call
+        returns a fresh copy so callers can modify it freely.
+        
         Returns:
             Configuration dictionary.
             
@@ -116,24 +158,50 @@ class ConfigManager:
         """
         if not self.config_path.exists():
             # Create default config if it doesn't exist
-            self.save_config(self.default_config)
-            return self.default_config.copy()
+            self.save_config(_DEFAULT_CONFIG)
+            return _clone(_DEFAULT_CONFIG)
         
         try:
+            st = os.stat(self.config_path)
+            key = (str(self.config_path), st.st_mtime_ns, st.st_size)
+            if key == self._cache_key:
+                return _clone(self._cache)
+            
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=_YamlLoader) or {}
             
-            # Merge with default config to ensure all keys exist
-            merged_config = self.default_config.copy()
-            merged_config.update(config)
+            # Merge with default config to ensure all keys exist, including
+            # keys inside nested sections
+            merged_config = self._deep_merge(_clone(_DEFAULT_CONFIG), config)
             
-            return merged_config
+            self._cache = merged_config
+            self._cache_key = key
+            return _clone(merged_config)
             
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in config file: {e}")
         except Exception as e:
             raise Exception(f"Error loading config file: {e}")
     
+    @staticmethod
+    def _deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge overlay into base in place, recursing where both hold a dict.
+        
+        Args:
+            base: Dictionary to merge into.
+            overlay: Dictionary whose values take precedence.
+            
+        Returns:
+            The updated base dictionary.
+        """
+        for key, value in overlay.items():
+            base_value = base.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
+                ConfigManager._deep_merge(base_value, value)
+            else:
+                base[key] = value
+        return base
+    
     def save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to file.
         
@@ -148,58 +216,106 @@ class ConfigManager:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Save with proper formatting
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2, sort_keys=False)
+            data = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, indent=2,
+                             sort_keys=False, encoding='utf-8')
             
+            # Nothing to do if the file still holds exactly what we last wrote
+            if self._last_write is not None and self._last_write[2] == data:
+                try:
+                    st = os.stat(self.config_path)
+                    if (st.st_mtime_ns, st.st_size) == self._last_write[:2]:
+                        return True
+                except OSError:
+                    pass
+            
+            # Write a sibling temp file and swap it in so a crash mid-write
+            # can't leave a truncated config behind
+            tmp_path = self.config_path.with_suffix(self.config_path.suffix + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+            
+            st = os.stat(self.config_path)
+            self._last_write = (st.st_mtime_ns, st.st_size, data)
+            self._validate_cache.clear()
+            self._cache_key = None
             return True
             
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
     
+    @staticmethod
+    def _config_key(config: Dict[str, Any]) -> tuple:
+        """Build a hashable key from the fields that validation depends on.
+        
+        Raises:
+            TypeError: If any of the fields holds an unhashable value.
+        """
+        player_names = config.get('player_names', [])
+        scoring_weights = config.get('scoring_weights', {})
+        key = (
+            config.get('captures_folder'),
+            config.get('data_folder'),
+            config.get('final_clips_folder'),
+            type(player_names),
+            tuple(player_names) if isinstance(player_names, list) else player_names,
+            tuple(config.get('killfeed_roi', [])),
+            tuple(config.get('chat_roi', [])),
+            tuple(sorted(scoring_weights.items())) if isinstance(scoring_weights, dict) else scoring_weights,
+        )
+        hash(key)
+        return key
+    
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         """Validate configuration and return list of errors.
         
+        Results are memoized per distinct set of validated values, so
+        repeated checks of an unchanged configuration are free.
+        
         Args:
             config: Configuration dictionary to validate.
             
         Returns:
             List of validation error messages.
         """
+        try:
+            key = self._config_key(config)
+        except TypeError:
+            return self._validate_config(config)
+        
+        errors = self._validate_cache.get(key)
+        if errors is None:
+            errors = self._validate_config(config)
+            self._validate_cache[key] = errors
+        return list(errors)
+    
+    def _validate_config(self, config: Dict[str, Any]) -> List[str]:
+        """Run the validation checks without consulting the cache."""
         errors = []
         
         # Check required paths
-        if not config.get('captures_folder'):
-            errors.append("Captures folder is required")
-        
-        if not config.get('data_folder'):
-            errors.append("Data folder is required")
-        
-        if not config.get('final_clips_folder'):
-            errors.append("Final clips folder is required")
+        for key, label in self._REQUIRED_PATHS:
+            if not config.get(key):
+                errors.append(f"{label} is required")
         
         # Check ROI coordinates
-        killfeed_roi = config.get('killfeed_roi', [])
-        if len(killfeed_roi) != 4:
-            errors.append("Killfeed ROI must have 4 coordinates [x1, y1, x2, y2]")
-        elif killfeed_roi[0] >= killfeed_roi[2] or killfeed_roi[1] >= killfeed_roi[3]:
-            errors.append("Invalid killfeed ROI coordinates")
-        
-        chat_roi = config.get('chat_roi', [])
-        if len(chat_roi) != 4:
-            errors.append("Chat ROI must have 4 coordinates [x1, y1, x2, y2]")
-        elif chat_roi[0] >= chat_roi[2] or chat_roi[1] >= chat_roi[3]:
-            errors.append("Invalid chat ROI coordinates")
+        for key, label in self._ROI_KEYS:
+            roi = config.get(key, [])
+            if len(roi) != 4:
+                errors.append(f"{label} ROI must have 4 coordinates [x1, y1, x2, y2]")
+                continue
+            x1, y1, x2, y2 = roi
+            if not (x1 < x2 and y1 < y2):
+                errors.append(f"Invalid {label.lower()} ROI coordinates")
         
         # Check player names
-        player_names = config.get('player_names', [])
-        if not isinstance(player_names, list):
+        if not isinstance(config.get('player_names', []), list):
             errors.append("Player names must be a list")
         
         # Check scoring weights
         scoring_weights = config.get('scoring_weights', {})
-        required_weights = ['kill', 'multi_kill_bonus', 'team_hype_voice', 'enemy_rage_chat', 'audio_spike']
-        for weight in required_weights:
+        for weight in self._REQUIRED_WEIGHTS:
             if weight not in scoring_weights:
                 errors.append(f"Missing scoring weight: {weight}")
             elif not isinstance(scoring_weights[weight], (int, float)):
@@ -213,7 +329,7 @@ class ConfigManager:
         Returns:
             Default configuration dictionary.
         """
-        return self.default_config.copy()
+        return _clone(_DEFAULT_CONFIG)
     
     def export_config(self, export_path: str) -> bool:
         """Export current configuration to a file.
@@ -229,7 +345,7 @@ class ConfigManager:
             export_path = Path(export_path)
             
             with open(export_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2, sort_keys=False)
+                yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2, sort_keys=False)
             
             return True
             
@@ -253,7 +369,7 @@ class ConfigManager:
                 return False
             
             with open(import_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
             
             if config is None:
                 return False
@@ -2,57 +2,202 @@
 Screenshot detection utilities for auto video detection.
 """
 
-import cv2
-import glob
+import json
 import os
+import shutil
+import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# cv2 is imported inside the methods that use it so importing this module
+# stays cheap
+if TYPE_CHECKING:
+    import cv2
+
+# Tuple so a single str.endswith call checks every extension
+_VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+
+
+def _iter_video_entries(root: str):
+    """Yield os.DirEntry objects for video files under root in a single walk.
+    
+    Hidden files and directories are skipped, as glob does, and directory
+    symlinks are not followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(_VIDEO_EXTENSIONS):
+                        yield entry
+        except OSError:
+            continue
+
+
+def _iter_videos(root: str):
+    """Yield video file paths under root in a single directory walk."""
+    for entry in _iter_video_entries(root):
+        yield entry.path
+
+
+def _entry_mtime(entry: os.DirEntry) -> float:
+    """Modification time of a directory entry, or 0 if it can't be read."""
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+
+@lru_cache(maxsize=1)
+def _ffprobe_path() -> Optional[str]:
+    """Locate ffprobe once per process."""
+    return shutil.which('ffprobe')
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_path() -> Optional[str]:
+    """Locate ffmpeg once per process."""
+    return shutil.which('ffmpeg')
+
+
+def _ffmpeg_frame_at_time(video_path: str, time_seconds: float):
+    """Decode a single frame with ffmpeg's input-side (keyframe) seek.
+    
+    Returns:
+        Frame as a BGR array, or None if ffmpeg is unavailable or fails.
+    """
+    ffmpeg = _ffmpeg_path()
+    if ffmpeg is None:
+        return None
+    
+    try:
+        result = subprocess.run(
+            [ffmpeg, '-loglevel', 'error', '-ss', str(time_seconds), '-i', video_path,
+             '-frames:v', '1', '-f', 'image2pipe', '-vcodec', 'bmp', '-'],
+            capture_output=True,
+            timeout=15
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    
+    if result.returncode != 0 or not result.stdout:
+        return None
+    
+    import cv2
+    import numpy as np
+    
+    return cv2.imdecode(np.frombuffer(result.stdout, np.uint8), cv2.IMREAD_COLOR)
+
+
+def _parse_rate(rate: str) -> float:
+    """Convert an ffprobe rate such as '60000/1001' to a float."""
+    num, _, den = rate.partition('/')
+    try:
+        return float(num) / float(den) if den else float(num)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _ffprobe_video_info(video_path: str) -> Optional[dict]:
+    """Read video stream metadata with ffprobe, without initializing a decoder.
+    
+    Returns:
+        Dictionary with video information, or None if ffprobe is unavailable
+        or fails.
+    """
+    ffprobe = _ffprobe_path()
+    if ffprobe is None:
+        return None
+    
+    try:
+        result = subprocess.run(
+            [ffprobe, '-v', 'error', '-select_streams', 'v:0',
+             '-show_entries', 'stream=width,height,r_frame_rate,nb_frames,duration',
+             '-of', 'json', video_path],
+            capture_output=True,
+            timeout=5
+        )
+        if result.returncode != 0:
+            return None
+        streams = json.loads(result.stdout).get('streams') or []
+    except (subprocess.SubprocessError, OSError, ValueError):
+        return None
+    
+    if not streams:
+        return None
+    
+    stream = streams[0]
+    fps = _parse_rate(stream.get('r_frame_rate', '0/1'))
+    try:
+        duration = float(stream.get('duration', 0))
+    except ValueError:
+        duration = 0
+    try:
+        frame_count = int(stream['nb_frames'])
+    except (KeyError, ValueError):
+        frame_count = int(duration * fps)
+    if not duration and fps > 0:
+        duration = frame_count / fps
+    
+    return {
+        'width': int(stream.get('width', 0)),
+        'height': int(stream.get('height', 0)),
+        'fps': fps,
+        'frame_count': frame_count,
+        'duration': duration
+    }
 
 
 class ScreenshotDetector:
     """Utility class for detecting and extracting frames from videos."""
     
     @staticmethod
-    def get_frame_from_first_video(captures_folder: str) -> Tuple[Optional[cv2.Mat], Optional[str]]:
+    def get_frame_from_first_video(captures_folder: str, newest: bool = False) -> Tuple[Optional['cv2.Mat'], Optional[str]]:
         """Extract a frame from the first video file found.
         
+        The video is chosen by find_first_video, so this picks the same file
+        as auto-detection does.
+        
         Args:
             captures_folder: Path to the folder containing video files
+            newest: Pick the most recently modified video instead of the
+                alphabetically first path
             
         Returns:
             Tuple of (frame, video_path) or (None, None) if no video found
         """
-        if not os.path.exists(captures_folder):
+        import cv2
+        
+        video_path = ScreenshotDetector.find_first_video(captures_folder, newest)
+        if video_path is None:
             return None, None
-            
-        # Find first video file
-        video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm']
-        for ext in video_extensions:
-            pattern = os.path.join(captures_folder, f"**/*{ext}")
-            video_files = glob.glob(pattern, recursive=True)
-            if video_files:
-                # Get a frame from the middle of the video
-                cap = cv2.VideoCapture(video_files[0])
-                if not cap.isOpened():
-                    continue
-                    
-                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                if total_frames > 0:
-                    middle_frame = total_frames // 2
-                    cap.set(cv2.CAP_PROP_POS_FRAMES, middle_frame)
-                    
-                    ret, frame = cap.read()
-                    cap.release()
-                    
-                    if ret:
-                        return frame, video_files[0]
-                else:
-                    cap.release()
-        
-        return None, None
+        
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            return None, None
+        
+        # Get a frame from the middle of the video
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if total_frames <= 0:
+            cap.release()
+            return None, None
+        
+        cap.set(cv2.CAP_PROP_POS_FRAMES, total_frames // 2)
+        ret, frame = cap.read()
+        cap.release()
+        
+        return (frame, video_path) if ret else (None, None)
     
     @staticmethod
-    def get_frame_at_time(video_path: str, time_seconds: float) -> Optional[cv2.Mat]:
+    def get_frame_at_time(video_path: str, time_seconds: float) -> Optional['cv2.Mat']:
         """Extract a frame at a specific time from a video.
         
         Args:
@@ -62,6 +207,13 @@ class ScreenshotDetector:
         Returns:
             Frame as OpenCV Mat or None if failed
         """
+        # ffmpeg seeks to the nearest keyframe instead of decoding from the start
+        frame = _ffmpeg_frame_at_time(video_path, time_seconds)
+        if frame is not None:
+            return frame
+        
+        import cv2
+        
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             return None
@@ -89,6 +241,13 @@ class ScreenshotDetector:
         Returns:
             Dictionary with video information
         """
+        # Metadata only: ffprobe avoids opening a decoder
+        info = _ffprobe_video_info(video_path)
+        if info is not None:
+            return info
+        
+        import cv2
+        
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             return {}
@@ -120,19 +279,39 @@ class ScreenshotDetector:
         if not os.path.exists(folder_path):
             return []
             
-        video_files = []
-        video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm']
+        return sorted(_iter_videos(folder_path))
+    
+    @staticmethod
+    def find_first_video(folder_path: str, newest: bool = False) -> Optional[str]:
+        """Find the first video file in a folder in a single directory walk.
         
-        for ext in video_extensions:
-            pattern = os.path.join(folder_path, f"**/*{ext}")
-            video_files.extend(glob.glob(pattern, recursive=True))
+        Directory listing order depends on the filesystem, so the match is
+        chosen explicitly rather than taking whichever is listed first.
+        
+        Args:
+            folder_path: Path to the folder to search
+            newest: Pick the most recently modified video instead of the
+                alphabetically first path
             
-        return sorted(video_files)
+        Returns:
+            Path to the chosen video, or None if there is none
+        """
+        if not os.path.exists(folder_path):
+            return None
+        
+        if newest:
+            entry = max(_iter_video_entries(folder_path), key=_entry_mtime, default=None)
+            return entry.path if entry is not None else None
+        
+        return min(_iter_videos(folder_path), default=None)
     
     @staticmethod
-    def extract_roi_from_frame(frame: cv2.Mat, roi: list) -> Optional[cv2.Mat]:
+    def extract_roi_from_frame(frame: 'cv2.Mat', roi: list) -> Optional['cv2.Mat']:
         """Extract a region of interest from a frame.
         
+        The result is a view into frame, not a copy: writes to it show up in
+        the frame. Only copy it if the frame buffer is going to be reused.
+        
         Args:
             frame: Input frame
             roi: ROI coordinates [x1, y1, x2, y2]
@@ -144,13 +323,10 @@ class ScreenshotDetector:
             return None
             
         x1, y1, x2, y2 = roi
+        height, width = frame.shape[:2]
         
         # Validate coordinates
-        if x1 >= x2 or y1 >= y2:
-            return None
-            
-        height, width = frame.shape[:2]
-        if x1 < 0 or y1 < 0 or x2 > width or y2 > height:
+        if not (0 <= x1 < x2 <= width and 0 <= y1 < y2 <= height):
             return None
             
         return frame[y1:y2, x1:x2]
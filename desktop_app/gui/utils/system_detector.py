@@ -2,16 +2,60 @@
 System detection utilities for the CHAOS desktop application.
 """
 
+import importlib.util
 import subprocess
 import sys
 import platform
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple, Optional
 
+# Required packages: distribution name -> import name
+_DEPENDENCY_MODULES = {
+    'pyyaml': 'yaml',
+    'pandas': 'pandas',
+    'tqdm': 'tqdm',
+    'opencv-python': 'cv2',
+    'easyocr': 'easyocr',
+    'whisper': 'whisper',
+    'librosa': 'librosa',
+    'thefuzz': 'thefuzz',
+    'PyQt6': 'PyQt6',
+    'Pillow': 'PIL',
+    'psutil': 'psutil',
+}
+
+
+@lru_cache(maxsize=1)
+def _system_info_snapshot() -> Dict[str, str]:
+    """Collect platform details once; platform.processor() can shell out."""
+    return {
+        'platform': platform.platform(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'python_version': sys.version,
+        'python_executable': sys.executable
+    }
+
 
 class SystemDetector:
-    """Detects system capabilities and requirements."""
+    """Detects system capabilities and requirements.
+    
+    The FFmpeg, CUDA and dependency probes are cached for the life of the
+    process; call clear_cache() after changing the system (e.g.
+    installing a package) to probe again. Treat cached results as read-only.
+    """
+    
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached probe results so the next calls probe again."""
+        cls.check_ffmpeg.cache_clear()
+        cls.detect_cuda.cache_clear()
+        cls.check_dependencies.cache_clear()
     
     @staticmethod
     def check_python_version() -> Tuple[bool, str]:
@@ -29,16 +73,22 @@ class SystemDetector:
         return is_compatible, version_string
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_ffmpeg() -> Tuple[bool, str]:
         """Check if FFmpeg is available.
         
         Returns:
             Tuple of (is_available, version_string_or_path)
         """
+        # Look the binary up first so a missing ffmpeg costs no fork/exec
+        ffmpeg_path = shutil.which('ffmpeg')
+        if ffmpeg_path is None:
+            return False, "FFmpeg not found in PATH"
+        
         try:
             # Try to run ffmpeg -version
             result = subprocess.run(
-                ['ffmpeg', '-version'],
+                [ffmpeg_path, '-version'],
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -59,6 +109,7 @@ class SystemDetector:
             return False, f"Error checking FFmpeg: {str(e)}"
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def detect_cuda() -> Dict[str, any]:
         """Detect CUDA availability and version.
         
@@ -66,6 +117,10 @@ class SystemDetector:
             Dictionary with CUDA information.
         """
         try:
+            # Skip the (slow) torch import attempt when it isn't installed
+            if 'torch' not in sys.modules and importlib.util.find_spec('torch') is None:
+                raise ImportError("torch is not installed")
+            
             import torch
             
             if torch.cuda.is_available():
@@ -129,44 +184,19 @@ class SystemDetector:
             return "pip install torch torchvision torchaudio"
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_dependencies() -> Dict[str, any]:
         """Check if all required dependencies are installed.
         
         Returns:
             Dictionary with dependency status.
         """
+        # find_spec only locates each package; nothing is imported or executed
         dependencies = {
-            'pyyaml': False,
-            'pandas': False,
-            'tqdm': False,
-            'opencv-python': False,
-            'easyocr': False,
-            'whisper': False,
-            'librosa': False,
-            'thefuzz': False,
-            'PyQt6': False,
-            'Pillow': False,
-            'psutil': False
+            dep: (module in sys.modules or importlib.util.find_spec(module) is not None)
+            for dep, module in _DEPENDENCY_MODULES.items()
         }
         
-        for dep in dependencies.keys():
-            try:
-                if dep == 'opencv-python':
-                    import cv2
-                elif dep == 'whisper':
-                    import whisper
-                elif dep == 'PyQt6':
-                    import PyQt6
-                elif dep == 'Pillow':
-                    import PIL
-                elif dep == 'pyyaml':
-                    import yaml
-                else:
-                    __import__(dep)
-                dependencies[dep] = True
-            except ImportError:
-                dependencies[dep] = False
-        
         return dependencies
     
     @staticmethod
@@ -176,16 +206,8 @@ class SystemDetector:
         Returns:
             Dictionary with system information.
         """
-        return {
-            'platform': platform.platform(),
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'python_version': sys.version,
-            'python_executable': sys.executable
-        }
+        # Copy so callers can't modify the shared snapshot
+        return dict(_system_info_snapshot())
     
     @staticmethod
     def check_disk_space(path: str = ".") -> Dict[str, any]:
@@ -240,23 +262,30 @@ class SystemDetector:
                     return False, "Homebrew not found. Please install FFmpeg manually."
             
             elif system == "linux":
-                # Try to install via package manager
+                # Try to install via whichever package managers are present
                 package_managers = [
-                    (["sudo", "apt", "update", "&&", "sudo", "apt", "install", "-y", "ffmpeg"], "apt"),
-                    (["sudo", "yum", "install", "-y", "ffmpeg"], "yum"),
-                    (["sudo", "dnf", "install", "-y", "ffmpeg"], "dnf"),
-                    (["sudo", "pacman", "-S", "--noconfirm", "ffmpeg"], "pacman")
+                    ("apt", [["sudo", "apt", "update"],
+                             ["sudo", "apt", "install", "-y", "ffmpeg"]]),
+                    ("yum", [["sudo", "yum", "install", "-y", "ffmpeg"]]),
+                    ("dnf", [["sudo", "dnf", "install", "-y", "ffmpeg"]]),
+                    ("pacman", [["sudo", "pacman", "-S", "--noconfirm", "ffmpeg"]])
                 ]
                 
-                for cmd, manager in package_managers:
+                for manager, commands in package_managers:
+                    if not shutil.which(manager):
+                        continue
+                    
                     try:
-                        result = subprocess.run(
-                            cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=300
-                        )
-                        if result.returncode == 0:
+                        for cmd in commands:
+                            result = subprocess.run(
+                                cmd,
+                                capture_output=True,
+                                text=True,
+                                timeout=300
+                            )
+                            if result.returncode != 0:
+                                break
+                        else:
                             return True, f"FFmpeg installed successfully via {manager}"
                     except (subprocess.TimeoutExpired, FileNotFoundError):
                         continue
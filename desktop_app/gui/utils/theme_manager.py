@@ -2,28 +2,32 @@
 Theme manager for the CHAOS desktop application.
 """
 
+import re
+
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QPalette, QColor
 from PyQt6.QtWidgets import QApplication
 
 
-class ThemeManager(QObject):
-    """Manages application themes and styling."""
-    
-    theme_changed = pyqtSignal(str)  # Emits when theme changes
+_QSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_QSS_SPACE_RE = re.compile(r'\s+')
+_QSS_PUNCT_RE = re.compile(r' ?([{};:,]) ?')
+
+
+def _minify_qss(stylesheet: str) -> str:
+    """Strip comments and redundant whitespace from a Qt stylesheet.
     
-    def __init__(self):
-        super().__init__()
-        self.current_theme = "default"
-        self.themes = {
-            "default": self.get_default_theme(),
-            "dark": self.get_dark_theme(),
-            "light": self.get_light_theme()
-        }
-        
-    def get_default_theme(self):
-        """Get the default theme stylesheet."""
-        return """
+    Qt's CSS parser is linear in input size, so this cuts the parse cost of
+    every setStyleSheet call without changing the rules themselves.
+    """
+    stylesheet = _QSS_COMMENT_RE.sub('', stylesheet)
+    stylesheet = _QSS_SPACE_RE.sub(' ', stylesheet)
+    return _QSS_PUNCT_RE.sub(r'\1', stylesheet).strip()
+
+
+# Pretty-printed sources, kept readable for editing. Only the minified
+# versions below are handed to Qt.
+_DEFAULT_QSS = """
         /* Default Theme */
         QMainWindow {
             background-color: #f5f5f5;
@@ -127,23 +131,23 @@ class ThemeManager(QObject):
             border-radius: 3px;
         }
         
-        QListWidget {
+        QListView#clipsList {
             border: 1px solid #c0c0c0;
             border-radius: 3px;
             background-color: white;
         }
         
-        QListWidget::item {
+        QListView#clipsList::item {
             padding: 5px;
             border-bottom: 1px solid #f0f0f0;
         }
         
-        QListWidget::item:selected {
+        QListView#clipsList::item:selected {
             background-color: #4CAF50;
             color: white;
         }
         
-        QListWidget::item:hover {
+        QListView#clipsList::item:hover {
             background-color: #f0f0f0;
         }
         
@@ -157,10 +161,8 @@ class ThemeManager(QObject):
             border-top: 1px solid #c0c0c0;
         }
         """
-        
-    def get_dark_theme(self):
-        """Get the dark theme stylesheet."""
-        return """
+
+_DARK_QSS = """
         /* Dark Theme */
         QMainWindow {
             background-color: #2b2b2b;
@@ -270,24 +272,24 @@ class ThemeManager(QObject):
             border-radius: 3px;
         }
         
-        QListWidget {
+        QListView#clipsList {
             border: 1px solid #555555;
             border-radius: 3px;
             background-color: #3c3c3c;
             color: #ffffff;
         }
         
-        QListWidget::item {
+        QListView#clipsList::item {
             padding: 5px;
             border-bottom: 1px solid #4a4a4a;
         }
         
-        QListWidget::item:selected {
+        QListView#clipsList::item:selected {
             background-color: #4CAF50;
             color: white;
         }
         
-        QListWidget::item:hover {
+        QListView#clipsList::item:hover {
             background-color: #4a4a4a;
         }
         
@@ -302,10 +304,8 @@ class ThemeManager(QObject):
             color: #ffffff;
         }
         """
-        
-    def get_light_theme(self):
-        """Get the light theme stylesheet."""
-        return """
+
+_LIGHT_QSS = """
         /* Light Theme */
         QMainWindow {
             background-color: #ffffff;
@@ -409,23 +409,23 @@ class ThemeManager(QObject):
             border-radius: 3px;
         }
         
-        QListWidget {
+        QListView#clipsList {
             border: 1px solid #d0d0d0;
             border-radius: 3px;
             background-color: #ffffff;
         }
         
-        QListWidget::item {
+        QListView#clipsList::item {
             padding: 5px;
             border-bottom: 1px solid #f5f5f5;
         }
         
-        QListWidget::item:selected {
+        QListView#clipsList::item:selected {
             background-color: #4CAF50;
             color: white;
         }
         
-        QListWidget::item:hover {
+        QListView#clipsList::item:hover {
             background-color: #f5f5f5;
         }
         
@@ -439,6 +439,107 @@ class ThemeManager(QObject):
             border-top: 1px solid #d0d0d0;
         }
         """
+
+# Widget rules applied under every theme, including the default one. Widgets
+# opt in with an object name or a dynamic property instead of setting their
+# own stylesheets, so changing state doesn't re-parse any CSS.
+_WIDGET_QSS = """
+        /* Progress tracker */
+        QProgressBar#overallProgress, QProgressBar#stageProgress {
+            border: 2px solid #444;
+            border-radius: 5px;
+            text-align: center;
+        }
+        
+        QProgressBar#overallProgress {
+            font-weight: bold;
+        }
+        
+        QProgressBar#overallProgress::chunk {
+            background-color: #4CAF50;
+            border-radius: 3px;
+        }
+        
+        QProgressBar#stageProgress::chunk {
+            background-color: #2196F3;
+            border-radius: 3px;
+        }
+        
+        QLabel#overallStatus {
+            font-weight: bold;
+            color: #666;
+        }
+        
+        QLabel#overallStatus[state="running"] {
+            color: #2196F3;
+        }
+        
+        QLabel#overallStatus[state="done"] {
+            color: #4CAF50;
+        }
+        
+        QLabel#stageStatus {
+            color: #666;
+        }
+        
+        QLabel[stageState="pending"], QLabel[stageState="current"], QLabel[stageState="done"] {
+            padding: 5px;
+            border-radius: 3px;
+        }
+        
+        QLabel[stageState="pending"] {
+            background-color: #f0f0f0;
+            color: #666;
+        }
+        
+        QLabel[stageState="current"] {
+            background-color: #2196F3;
+            color: white;
+            font-weight: bold;
+        }
+        
+        QLabel[stageState="done"] {
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+        }
+        """
+
+# Minified once at import and shared by every ThemeManager
+_WIDGET_QSS_MIN = _minify_qss(_WIDGET_QSS)
+_DEFAULT_QSS_MIN = _minify_qss(_DEFAULT_QSS)
+_DARK_QSS_MIN = _minify_qss(_DARK_QSS)
+_LIGHT_QSS_MIN = _minify_qss(_LIGHT_QSS)
+
+
+class ThemeManager(QObject):
+    """Manages application themes and styling."""
+    
+    theme_changed = pyqtSignal(str)  # Emits when theme changes
+    
+    def __init__(self):
+        super().__init__()
+        self.current_theme = "default"
+        self._applied_theme = None  # theme last pushed to the QApplication
+        self._system_palette = None  # style's standard palette, built on first use
+        self._watching_scheme = False
+        self.themes = {
+            "default": self.get_default_theme(),
+            "dark": self.get_dark_theme(),
+            "light": self.get_light_theme()
+        }
+        
+    def get_default_theme(self):
+        """Get the default theme stylesheet."""
+        return _DEFAULT_QSS_MIN
+        
+    def get_dark_theme(self):
+        """Get the dark theme stylesheet."""
+        return _DARK_QSS_MIN
+        
+    def get_light_theme(self):
+        """Get the light theme stylesheet."""
+        return _LIGHT_QSS_MIN
         
     def apply_theme(self, theme_name: str):
         """Apply a theme to the application."""
@@ -448,16 +549,23 @@ class ThemeManager(QObject):
         self.current_theme = theme_name
         
         app = QApplication.instance()
+        
+        # Re-applying the same stylesheet makes Qt re-parse it and re-polish
+        # every widget, so skip it when nothing changes
+        if app and theme_name == self._applied_theme:
+            return
+        
         if app:
             if theme_name == "default":
-                # For default theme, use system styling (no custom stylesheet)
-                app.setStyleSheet("")
+                # For default theme, use system styling (only the widget rules)
+                app.setStyleSheet(_WIDGET_QSS_MIN)
                 # Apply system palette for proper dark mode support
                 self.apply_system_palette()
             else:
                 # Apply custom theme stylesheet
                 stylesheet = self.themes[theme_name]
-                app.setStyleSheet(stylesheet)
+                app.setStyleSheet(stylesheet + _WIDGET_QSS_MIN)
+            self._applied_theme = theme_name
             
         self.theme_changed.emit(theme_name)
         
@@ -467,7 +575,22 @@ class ThemeManager(QObject):
         if app:
             # Let the system handle the palette automatically
             # This ensures proper dark mode support on macOS and other systems
-            app.setPalette(QApplication.style().standardPalette())
+            if self._system_palette is None:
+                self._system_palette = QApplication.style().standardPalette()
+                # Rebuild it if the OS switches between light and dark
+                # (colorSchemeChanged needs Qt 6.5)
+                if not self._watching_scheme:
+                    hints = app.styleHints()
+                    if hasattr(hints, 'colorSchemeChanged'):
+                        hints.colorSchemeChanged.connect(self._invalidate_system_palette)
+                    self._watching_scheme = True
+            app.setPalette(self._system_palette)
+    
+    def _invalidate_system_palette(self, *args):
+        """Drop the cached palette and reapply it if the default theme is active."""
+        self._system_palette = None
+        if self._applied_theme == "default":
+            self.apply_system_palette()
         
     def get_available_themes(self):
         """Get list of available themes."""
@@ -3,12 +3,19 @@ Clip preview widget for playing generated video clips.
 """
 
 import os
-import cv2
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QSlider, QFrame, QSizePolicy)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QPixmap, QImage
 
+# cv2 is imported on first use so the GUI can start without loading OpenCV
+
+# Enum members used per frame, resolved once instead of on every lookup
+_KEEP_AR = Qt.AspectRatioMode.KeepAspectRatio
+_SMOOTH = Qt.TransformationMode.SmoothTransformation
+_FAST = Qt.TransformationMode.FastTransformation
+_FMT_BGR888 = QImage.Format.Format_BGR888
+
 
 class ClipPreviewWidget(QWidget):
     """Widget for previewing video clips."""
@@ -21,6 +28,12 @@ class ClipPreviewWidget(QWidget):
         self.total_frames = 0
         self.fps = 30
         self.is_playing = False
+        self._is_seeking = False  # slider being dragged
+        self._frame_seq = 0  # bumped whenever current_frame changes
+        self._frame_step = 1  # source frames advanced per timer tick
+        self._total_time_str = "00:00"  # fixed for the loaded clip
+        self._shown_second = None  # current second shown in time_label
+        self._scaled_cache = None  # (frame_seq, size, transformation, scaled pixmap)
         self.clip_path = None
         self.init_ui()
         
@@ -48,6 +61,8 @@ class ClipPreviewWidget(QWidget):
         self.seek_slider = QSlider(Qt.Orientation.Horizontal)
         self.seek_slider.setRange(0, 0)
         self.seek_slider.sliderMoved.connect(self.seek_to_frame)
+        self.seek_slider.sliderPressed.connect(self.on_slider_pressed)
+        self.seek_slider.sliderReleased.connect(self.on_slider_released)
         self.seek_slider.setEnabled(False)
         controls_layout.addWidget(self.seek_slider)
         
@@ -66,14 +81,23 @@ class ClipPreviewWidget(QWidget):
         
         # Timer for video playback
         self.play_timer = QTimer(self)
+        self.play_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.play_timer.timeout.connect(self.next_frame)
         
+        # Coalesces bursts of resize events into a single rescale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.update_display)
+        
     def load_clip(self, clip_path: str):
         """Load a video clip for preview."""
         if not os.path.exists(clip_path):
             self.video_display.setText("Clip file not found")
             return False
             
+        import cv2
+        
         # Release previous video
         if self.video_cap:
             self.video_cap.release()
@@ -89,6 +113,11 @@ class ClipPreviewWidget(QWidget):
         if self.fps == 0:
             self.fps = 30  # Default to 30 if not detected
             
+        # The total duration never changes for a clip, so format it once
+        total_seconds = int(self.total_frames / self.fps)
+        self._total_time_str = f"{total_seconds // 60:02d}:{total_seconds % 60:02d}"
+        self._shown_second = None
+        
         # Update UI
         self.seek_slider.setRange(0, self.total_frames - 1)
         self.seek_slider.setEnabled(True)
@@ -111,33 +140,81 @@ class ClipPreviewWidget(QWidget):
         self.is_playing = not self.is_playing
         if self.is_playing:
             self.play_pause_btn.setText("⏸️")
-            self.play_timer.start(int(1000 / self.fps))  # Milliseconds per frame
+            # Never tick faster than a 60 Hz display can show; high frame rate
+            # clips advance several source frames per tick instead
+            self._frame_step = max(1, int(round(self.fps / 60)))
+            self.play_timer.start(max(16, int(round(1000.0 * self._frame_step / self.fps))))
         else:
             self.play_pause_btn.setText("▶️")
             self.play_timer.stop()
+            # Redraw the paused frame with smooth scaling
+            self.update_display()
             
+    def on_slider_pressed(self):
+        """Use fast scaling while the user scrubs."""
+        self._is_seeking = True
+        
+    def on_slider_released(self):
+        """Redraw the final scrub position with smooth scaling."""
+        self._is_seeking = False
+        self.update_display()
+        
     def next_frame(self):
         """Advance to the next frame."""
         if not self.video_cap or not self.video_cap.isOpened():
             return
             
-        self.current_frame_number += 1
-        if self.current_frame_number >= self.total_frames:
-            self.current_frame_number = self.total_frames - 1
+        if self.current_frame_number + self._frame_step >= self.total_frames:
             self.toggle_play_pause()  # Stop playback at end
+            return
+            
+        # The capture already sits just past the displayed frame, so a plain
+        # read continues decoding without a keyframe seek
+        if not self._advance_one_frame():
+            self.toggle_play_pause()  # Stop playback
             
-        self.seek_to_frame(self.current_frame_number)
+    def _advance_one_frame(self):
+        """Decode and display the next frame in sequence.
+        
+        When _frame_step is above 1 the frames in between are grabbed but
+        never retrieved or displayed.
+        
+        Returns:
+            True if a frame was read, False at end of stream or on error.
+        """
+        for _ in range(self._frame_step - 1):
+            if not self.video_cap.grab():
+                return False
+            
+        ret, frame = self.video_cap.read()
+        if not ret:
+            return False
+            
+        self.current_frame = frame
+        self._frame_seq += 1
+        self.current_frame_number += self._frame_step
+        self.seek_slider.setValue(self.current_frame_number)
+        self.update_display()
+        self.update_time_label()
+        return True
         
     def seek_to_frame(self, frame_number):
-        """Seek to specific frame and display it."""
+        """Seek to specific frame and display it.
+        
+        Used for slider scrubbing and clip loading; playback advances with
+        _advance_one_frame instead.
+        """
         if not self.video_cap or not self.video_cap.isOpened():
             return
             
+        import cv2
+        
         self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
         ret, frame = self.video_cap.read()
         
         if ret:
             self.current_frame = frame
+            self._frame_seq += 1
             self.current_frame_number = frame_number
             self.seek_slider.setValue(frame_number)
             self.update_display()
@@ -154,32 +231,48 @@ class ClipPreviewWidget(QWidget):
         if self.current_frame is None:
             return
             
-        # Convert BGR to RGB for Qt
-        frame_rgb = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-        height, width, channel = frame_rgb.shape
-        bytes_per_line = 3 * width
+        # Smooth scaling is only worth it for a frame that stays on screen
+        transformation = _FAST if self.is_playing or self._is_seeking else _SMOOTH
+        
+        # Reuse the last scaled pixmap if neither the frame nor the target
+        # size changed, e.g. repeated resize events while paused
+        target_size = self.video_display.size()
+        cache = self._scaled_cache
+        if (cache is not None and cache[0] == self._frame_seq
+                and cache[1] == target_size and cache[2] == transformation):
+            self.video_display.setPixmap(cache[3])
+            return
+            
+        # Wrap the BGR buffer directly instead of converting to RGB first.
+        # self.current_frame keeps the buffer alive while the QImage uses it.
+        frame = self.current_frame
+        height, width = frame.shape[:2]
+        bytes_per_line = frame.strides[0]
         
-        # Create QImage
-        q_image = QImage(frame_rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_image)
+        q_image = QImage(frame.data, width, height, bytes_per_line, _FMT_BGR888)
         
-        # Scale pixmap to fit widget while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            self.video_display.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        # Scale the wrapped image to fit the widget while maintaining aspect
+        # ratio, then convert only the scaled result, so no full-resolution
+        # pixmap copy of the frame is ever allocated
+        scaled_pixmap = QPixmap.fromImage(q_image.scaled(
+            target_size,
+            _KEEP_AR,
+            transformation
+        ))
         
+        self._scaled_cache = (self._frame_seq, target_size, transformation, scaled_pixmap)
         self.video_display.setPixmap(scaled_pixmap)
         
     def update_time_label(self):
         """Update the current time / total time label."""
-        current_seconds = self.current_frame_number / self.fps
-        total_seconds = self.total_frames / self.fps
+        current_seconds = int(self.current_frame_number / self.fps)
+        
+        # Most frames fall in the second already shown; skip the relayout
+        if current_seconds == self._shown_second:
+            return
+        self._shown_second = current_seconds
         
-        current_time_str = f"{int(current_seconds // 60):02d}:{int(current_seconds % 60):02d}"
-        total_time_str = f"{int(total_seconds // 60):02d}:{int(total_seconds % 60):02d}"
-        self.time_label.setText(f"{current_time_str} / {total_time_str}")
+        self.time_label.setText(f"{current_seconds // 60:02d}:{current_seconds % 60:02d} / {self._total_time_str}")
         
     def clear(self):
         """Clear the preview."""
@@ -187,12 +280,15 @@ class ClipPreviewWidget(QWidget):
             self.video_cap.release()
             self.video_cap = None
             
+        self._scaled_cache = None
         self.is_playing = False
         self.play_timer.stop()
+        self._resize_timer.stop()
         self.play_pause_btn.setText("▶️")
         self.play_pause_btn.setEnabled(False)
         self.seek_slider.setRange(0, 0)
         self.seek_slider.setEnabled(False)
+        self._shown_second = None
         self.time_label.setText("00:00 / 00:00")
         self.info_label.setText("No clip loaded")
         self.video_display.setText("No clip selected")
@@ -202,4 +298,12 @@ class ClipPreviewWidget(QWidget):
         """Handle widget resize."""
         super().resizeEvent(event)
         if self.current_frame is not None:
-            self.update_display()
+            # Rescale once the resize settles; restarting the timer on each
+            # event keeps drag-resizes from rescaling on every mouse move
+            self._resize_timer.start()
+            
+    def hideEvent(self, event):
+        """Pause playback while hidden so frames aren't decoded off-screen."""
+        super().hideEvent(event)
+        if self.is_playing:
+            self.toggle_play_pause()
@@ -6,7 +6,32 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
                             QPushButton, QLabel, QCheckBox, QGroupBox)
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
+import time
+from collections import defaultdict, deque
 from datetime import datetime
+from itertools import groupby, islice
+from typing import NamedTuple
+
+
+# Foreground colour per log level; "" is the fallback for unknown levels
+_LEVEL_COLORS = (
+    ("error", "#ff6b6b"),    # Red
+    ("warning", "#ffd93d"),  # Yellow
+    ("success", "#6bcf7f"),  # Green
+    ("info", "#74c0fc"),     # Blue
+    ("", "#ffffff"),         # White
+)
+
+# Resolved once; used for every flush
+_MOVE_END = QTextCursor.MoveOperation.End
+
+
+class LogEntry(NamedTuple):
+    """A stored log message."""
+    timestamp: str
+    level: str
+    message: str
+    lower: str  # message lowercased once at insert, for search_messages
 
 
 class LogViewer(QWidget):
@@ -14,8 +39,19 @@ class LogViewer(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.log_messages = []
         self.max_messages = 1000  # Keep last 1000 messages
+        # Bounded deque drops the oldest entry in O(1) once full
+        self.log_messages = deque(maxlen=self.max_messages)
+        # Secondary index: the entries of log_messages grouped by level
+        self._by_level = defaultdict(deque)
+        # Built once so appending a line doesn't create new format objects
+        self._formats = {level: self._make_format(color) for level, color in _LEVEL_COLORS}
+        self._pending = deque()  # (formatted message, level) awaiting display
+        self._last_timestamp = None
+        self._display_stale = False  # messages arrived while hidden
+        # Timestamp string is reformatted only when the second changes
+        self._ts_sec = 0
+        self._ts_str = ""
         self.init_ui()
         
     def init_ui(self):
@@ -49,6 +85,12 @@ class LogViewer(QWidget):
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 9))
+        # Log output is append-only: no undo history, and let Qt drop the
+        # oldest blocks itself once the history limit is reached. Without
+        # wrapping, a horizontal resize doesn't re-lay out every line.
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.document().setMaximumBlockCount(self.max_messages)
+        self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self.log_display.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -66,6 +108,20 @@ class LogViewer(QWidget):
         
         self.setLayout(layout)
         
+        # Pending messages are written to the display in batches so a chatty
+        # pipeline costs one text layout pass per flush instead of per line
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(80)
+        self._flush_timer.timeout.connect(self._flush)
+        
+    @staticmethod
+    def _make_format(color: str) -> QTextCharFormat:
+        """Build a character format with the given foreground colour."""
+        text_format = QTextCharFormat()
+        text_format.setForeground(QColor(color))
+        return text_format
+        
     def add_message(self, message: str, level: str = "info"):
         """Add a log message to the display.
         
@@ -73,60 +129,110 @@ class LogViewer(QWidget):
             message: The log message
             level: Log level (info, warning, error, success)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.add_messages((message,), level)
         
-        # Format message with timestamp
-        formatted_message = f"[{timestamp}] {message}"
+    def add_messages(self, messages, level: str = "info"):
+        """Add several log messages with the same level at once.
         
-        # Store message
-        self.log_messages.append({
-            'timestamp': timestamp,
-            'message': message,
-            'level': level,
-            'formatted': formatted_message
-        })
+        Args:
+            messages: The log messages, oldest first
+            level: Log level (info, warning, error, success)
+        """
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        timestamp = self._ts_str
         
-        # Keep only last max_messages
-        if len(self.log_messages) > self.max_messages:
-            self.log_messages.pop(0)
+        visible = self.log_display.isVisible()
+        level_index = self._by_level[level]
+        for message in messages:
+            # Store message, evicting the oldest entry from its level index too
+            if len(self.log_messages) == self.max_messages:
+                self._by_level[self.log_messages[0].level].popleft()
+            entry = LogEntry(timestamp, level, message, message.lower())
+            self.log_messages.append(entry)
+            level_index.append(entry)
+            
+            if visible:
+                self._pending.append((f"[{timestamp}] {message}", level))
         
-        # Add to display
-        self.append_to_display(formatted_message, level)
+        self._last_timestamp = timestamp
         
-        # Update status
-        self.status_label.setText(f"Last message: {timestamp}")
+        # Nobody can see the display while it is hidden; showEvent rebuilds
+        # it from log_messages instead
+        if not visible:
+            self._display_stale = True
+            return
         
-    def append_to_display(self, message: str, level: str):
-        """Append message to the text display with appropriate formatting."""
-        cursor = self.log_display.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # The timer flushes everything queued meanwhile
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        
+    def _flush(self):
+        """Write all pending messages to the display."""
+        if not self._pending:
+            return
         
-        # Set text format based on level
-        format = QTextCharFormat()
+        pending = self._pending
+        self._pending = deque()
         
-        if level == "error":
-            format.setForeground(QColor("#ff6b6b"))  # Red
-        elif level == "warning":
-            format.setForeground(QColor("#ffd93d"))  # Yellow
-        elif level == "success":
-            format.setForeground(QColor("#6bcf7f"))  # Green
-        elif level == "info":
-            format.setForeground(QColor("#74c0fc"))  # Blue
-        else:
-            format.setForeground(QColor("#ffffff"))  # White
+        if not self.log_display.isVisible():
+            self._display_stale = True
+            return
         
-        cursor.setCharFormat(format)
-        cursor.insertText(message + "\n")
+        cursor = self.log_display.textCursor()
+        cursor.movePosition(_MOVE_END)
+        self._insert_lines(cursor, pending)
+        self._finish_update(cursor)
+        
+    def _insert_lines(self, cursor: QTextCursor, lines):
+        """Insert (text, level) pairs at the cursor in one edit block.
+        
+        Consecutive lines with the same level share a single insertText call.
+        """
+        cursor.beginEditBlock()
+        for level, group in groupby(lines, key=lambda item: item[1]):
+            cursor.setCharFormat(self._formats.get(level, self._formats[""]))
+            cursor.insertText("\n".join(text for text, _ in group) + "\n")
+        cursor.endEditBlock()
         
+    def _finish_update(self, cursor: QTextCursor):
+        """Scroll to the cursor if enabled and refresh the status label."""
         # Auto-scroll if enabled
         if self.auto_scroll_cb.isChecked():
             self.log_display.setTextCursor(cursor)
             self.log_display.ensureCursorVisible()
-    
+        
+        # Update status
+        if self._last_timestamp is not None:
+            self.status_label.setText(f"Last message: {self._last_timestamp}")
+        
+    def _repopulate_display(self):
+        """Rebuild the display from log_messages in a single pass."""
+        self._pending.clear()
+        self.log_display.clear()
+        
+        cursor = self.log_display.textCursor()
+        self._insert_lines(cursor, ((f"[{entry.timestamp}] {entry.message}", entry.level)
+                                    for entry in self.log_messages))
+        self._finish_update(cursor)
+        self._display_stale = False
+        
+    def showEvent(self, event):
+        """Catch up on messages that arrived while hidden."""
+        super().showEvent(event)
+        if self._display_stale:
+            self._repopulate_display()
+        
     def clear_log(self):
         """Clear all log messages."""
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._display_stale = False
         self.log_display.clear()
         self.log_messages.clear()
+        self._by_level.clear()
         self.status_label.setText("Log cleared")
         
     def export_log(self):
@@ -142,12 +248,13 @@ class LogViewer(QWidget):
         
         if file_path:
             try:
+                # Build the whole export first and write it in one call
+                content = "CHAOS Pipeline Log\n" + "=" * 50 + "\n\n" + "".join(
+                    f"[{log_entry.timestamp}] [{log_entry.level.upper()}] {log_entry.message}\n"
+                    for log_entry in self.log_messages
+                )
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("CHAOS Pipeline Log\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    for log_entry in self.log_messages:
-                        f.write(f"[{log_entry['timestamp']}] [{log_entry['level'].upper()}] {log_entry['message']}\n")
+                    f.write(content)
                 
                 self.add_message(f"Log exported to {file_path}", "success")
                 
@@ -160,15 +267,16 @@ class LogViewer(QWidget):
     
     def get_recent_messages(self, count: int = 10) -> list:
         """Get the most recent log messages."""
-        return self.log_messages[-count:] if self.log_messages else []
+        return list(islice(self.log_messages, max(0, len(self.log_messages) - count), None))
     
     def filter_messages(self, level: str = None) -> list:
         """Filter messages by level."""
         if level is None:
-            return self.log_messages
-        return [msg for msg in self.log_messages if msg['level'] == level]
+            return list(self.log_messages)
+        entries = self._by_level.get(level)
+        return list(entries) if entries else []
     
     def search_messages(self, query: str) -> list:
         """Search messages containing the query."""
         query_lower = query.lower()
-        return [msg for msg in self.log_messages if query_lower in msg['message'].lower()]
+        return [msg for msg in self.log_messages if query_lower in msg.lower]
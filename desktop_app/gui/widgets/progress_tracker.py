@@ -2,11 +2,36 @@
 Progress tracking widget for pipeline execution.
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QProgressBar, QGroupBox, QFrame)
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QPalette
 
+# Display names per pipeline stage; built once rather than per lookup
+_STAGE_NAMES = {
+    "ingest": "📁 Video Ingestion",
+    "analyze": "🔍 Video Analysis", 
+    "correlate": "🔗 Event Correlation",
+    "clip": "✂️ Video Clipping",
+    "summary": "📊 Summary Generation"
+}
+
+
+@contextmanager
+def _updates_suspended(widget):
+    """Hold off repaints of widget until the block exits.
+    
+    Restores the previous state, so nested uses only repaint once at the end.
+    """
+    enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(enabled)
+
 
 class ProgressTracker(QWidget):
     """Widget for tracking pipeline execution progress."""
@@ -18,6 +43,11 @@ class ProgressTracker(QWidget):
         self.overall_progress = 0
         self.stages = []
         self.completed_stages = set()
+        self._stage_labels = {}  # stage -> QLabel, built by set_stages
+        # Latest bar values not yet shown; None when nothing is pending
+        self._pending_overall = None
+        self._pending_stage = None
+        self._overall_state = "idle"  # last state applied to overall_status_label
         self.init_ui()
         
     def init_ui(self):
@@ -31,23 +61,14 @@ class ProgressTracker(QWidget):
         self.overall_progress_bar = QProgressBar()
         self.overall_progress_bar.setRange(0, 100)
         self.overall_progress_bar.setValue(0)
-        self.overall_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
+        # Styled by the application stylesheet (see theme_manager)
+        self.overall_progress_bar.setObjectName("overallProgress")
         overall_layout.addWidget(self.overall_progress_bar)
         
         self.overall_status_label = QLabel("Ready")
         self.overall_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.overall_status_label.setStyleSheet("font-weight: bold; color: #666;")
+        self.overall_status_label.setObjectName("overallStatus")
+        self.overall_status_label.setProperty("state", "idle")
         overall_layout.addWidget(self.overall_status_label)
         
         overall_group.setLayout(overall_layout)
@@ -65,22 +86,12 @@ class ProgressTracker(QWidget):
         self.stage_progress_bar = QProgressBar()
         self.stage_progress_bar.setRange(0, 100)
         self.stage_progress_bar.setValue(0)
-        self.stage_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #2196F3;
-                border-radius: 3px;
-            }
-        """)
+        self.stage_progress_bar.setObjectName("stageProgress")
         stage_layout.addWidget(self.stage_progress_bar)
         
         self.stage_status_label = QLabel("")
         self.stage_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.stage_status_label.setStyleSheet("color: #666;")
+        self.stage_status_label.setObjectName("stageStatus")
         stage_layout.addWidget(self.stage_status_label)
         
         stage_group.setLayout(stage_layout)
@@ -100,87 +111,120 @@ class ProgressTracker(QWidget):
         
         self.setLayout(layout)
         
+        # Progress bars repaint at most ~30 times a second; intermediate
+        # values reported in between are dropped
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+    def _schedule_progress(self):
+        """Start the flush timer unless a flush is already due."""
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+        
+    def _flush_progress(self):
+        """Show the latest pending progress values."""
+        for bar, value in ((self.overall_progress_bar, self._pending_overall),
+                           (self.stage_progress_bar, self._pending_stage)):
+            if value is not None and bar.value() != value:
+                bar.setValue(value)
+        self._pending_overall = None
+        self._pending_stage = None
+        
     def set_stages(self, stages: list):
         """Set the list of pipeline stages."""
         self.stages = stages
         self.completed_stages.clear()
-        self.update_stages_display()
         
-    def update_stages_display(self):
-        """Update the stages display."""
-        # Clear existing stage labels
-        for i in reversed(range(self.stages_layout.count())):
-            self.stages_layout.itemAt(i).widget().setParent(None)
-        
-        # Add stage labels
-        for i, stage in enumerate(self.stages):
-            stage_label = QLabel(f"{i+1}. {self.format_stage_name(stage)}")
-            stage_label.setStyleSheet("padding: 5px; border-radius: 3px;")
+        with _updates_suspended(self.stages_frame):
+            # Replace the old labels; from here on they are only restyled
+            for label in self._stage_labels.values():
+                label.setParent(None)
+            self._stage_labels = {}
             
-            if stage in self.completed_stages:
-                stage_label.setStyleSheet("""
-                    padding: 5px; 
-                    border-radius: 3px; 
-                    background-color: #4CAF50; 
-                    color: white; 
-                    font-weight: bold;
-                """)
-            elif stage == self.current_stage:
-                stage_label.setStyleSheet("""
-                    padding: 5px; 
-                    border-radius: 3px; 
-                    background-color: #2196F3; 
-                    color: white; 
-                    font-weight: bold;
-                """)
-            else:
-                stage_label.setStyleSheet("""
-                    padding: 5px; 
-                    border-radius: 3px; 
-                    background-color: #f0f0f0; 
-                    color: #666;
-                """)
+            for i, stage in enumerate(self.stages):
+                stage_label = QLabel(f"{i+1}. {self.format_stage_name(stage)}")
+                stage_label.setProperty("stageState", "pending")
+                self._stage_labels[stage] = stage_label
+                self.stages_layout.addWidget(stage_label)
             
-            self.stages_layout.addWidget(stage_label)
+            self.update_stages_display()
+        
+    def update_stages_display(self):
+        """Update the stages display."""
+        with _updates_suspended(self.stages_frame):
+            for stage in self._stage_labels:
+                self._update_stage_label(stage)
+    
+    def _update_stage_label(self, stage):
+        """Restyle one stage label to match its state."""
+        label = self._stage_labels.get(stage)
+        if label is None:
+            return
+        
+        if stage in self.completed_stages:
+            state = "done"
+        elif stage == self.current_stage:
+            state = "current"
+        else:
+            state = "pending"
+        
+        self._set_style_state(label, "stageState", state)
+    
+    @staticmethod
+    def _set_style_state(widget, name, value):
+        """Set a dynamic property used by stylesheet selectors and re-polish.
+        
+        Does nothing if the property already holds value.
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        # Property selectors are only re-evaluated on polish
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
     
     def format_stage_name(self, stage: str) -> str:
         """Format stage name for display."""
-        stage_names = {
-            "ingest": "📁 Video Ingestion",
-            "analyze": "🔍 Video Analysis", 
-            "correlate": "🔗 Event Correlation",
-            "clip": "✂️ Video Clipping",
-            "summary": "📊 Summary Generation"
-        }
-        return stage_names.get(stage, stage.title())
+        return _STAGE_NAMES.get(stage, stage.title())
     
     def update_overall_progress(self, progress: int, status: str = ""):
         """Update overall progress."""
         self.overall_progress = progress
-        self.overall_progress_bar.setValue(progress)
+        self._pending_overall = progress
+        self._schedule_progress()
         
         if status:
             self.overall_status_label.setText(status)
         
-        # Update overall status color based on progress
+        # Update overall status color based on progress; most ticks stay in
+        # the same state, so skip even the property lookup for those
         if progress == 0:
-            self.overall_status_label.setStyleSheet("font-weight: bold; color: #666;")
+            state = "idle"
         elif progress == 100:
-            self.overall_status_label.setStyleSheet("font-weight: bold; color: #4CAF50;")
+            state = "done"
         else:
-            self.overall_status_label.setStyleSheet("font-weight: bold; color: #2196F3;")
+            state = "running"
+        if state != self._overall_state:
+            self._overall_state = state
+            self._set_style_state(self.overall_status_label, "state", state)
     
     def update_stage_progress(self, stage: str, progress: int, status: str = ""):
         """Update current stage progress."""
         if stage != self.current_stage:
             # New stage started
-            if self.current_stage:
-                self.completed_stages.add(self.current_stage)
+            previous_stage = self.current_stage
+            if previous_stage:
+                self.completed_stages.add(previous_stage)
             self.current_stage = stage
-            self.update_stages_display()
+            self._update_stage_label(previous_stage)
+            self._update_stage_label(stage)
         
         self.stage_progress = progress
-        self.stage_progress_bar.setValue(progress)
+        self._pending_stage = progress
+        self._schedule_progress()
         
         if status:
             self.stage_status_label.setText(status)
@@ -196,12 +240,13 @@ class ProgressTracker(QWidget):
             # Mark as failed (could add different styling)
             pass
         
-        self.update_stages_display()
+        self._update_stage_label(stage)
         
         # Clear current stage if it was completed
         if stage == self.current_stage:
             self.current_stage = None
             self.stage_name_label.setText("No stage running")
+            self._pending_stage = None
             self.stage_progress_bar.setValue(0)
             self.stage_status_label.setText("")
     
@@ -212,15 +257,21 @@ class ProgressTracker(QWidget):
         self.overall_progress = 0
         self.completed_stages.clear()
         
-        self.overall_progress_bar.setValue(0)
-        self.overall_status_label.setText("Ready")
-        self.overall_status_label.setStyleSheet("font-weight: bold; color: #666;")
+        self._progress_timer.stop()
+        self._pending_overall = None
+        self._pending_stage = None
         
-        self.stage_name_label.setText("No stage running")
-        self.stage_progress_bar.setValue(0)
-        self.stage_status_label.setText("")
-        
-        self.update_stages_display()
+        with _updates_suspended(self):
+            self.overall_progress_bar.setValue(0)
+            self.overall_status_label.setText("Ready")
+            self._overall_state = "idle"
+            self._set_style_state(self.overall_status_label, "state", "idle")
+            
+            self.stage_name_label.setText("No stage running")
+            self.stage_progress_bar.setValue(0)
+            self.stage_status_label.setText("")
+            
+            self.update_stages_display()
     
     def get_progress_info(self) -> dict:
         """Get current progress information."""
@@ -0,0 +1,80 @@
+"""
+Label widget that paints cached text layout.
+"""
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QSize, QPointF, QEvent
+from PyQt6.QtGui import QPainter, QPalette, QStaticText
+
+
+class StaticTextLabel(QWidget):
+    """Single-line label backed by QStaticText.
+    
+    The glyph layout is computed once per text change instead of on every
+    paint, which suits titles and status text that rarely change.
+    """
+    
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self._static_text = QStaticText(text)
+        self._static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        self._alignment = Qt.AlignmentFlag.AlignLeft
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self._prepare()
+    
+    def _prepare(self):
+        """Lay out the text with the widget's current font."""
+        self._static_text.prepare(font=self.font())
+    
+    def text(self):
+        """Get the label text."""
+        return self._static_text.text()
+    
+    def setText(self, text):
+        """Set the label text, skipping the relayout when it is unchanged."""
+        if text == self._static_text.text():
+            return
+        self._static_text.setText(text)
+        self._prepare()
+        self.updateGeometry()
+        self.update()
+    
+    def setAlignment(self, alignment):
+        """Set the horizontal alignment of the text."""
+        self._alignment = alignment
+        self.update()
+    
+    def changeEvent(self, event):
+        """Re-measure the text when the font changes (setFont or a stylesheet)."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._prepare()
+            self.updateGeometry()
+            self.update()
+    
+    def sizeHint(self):
+        """Size the label to fit its text as laid out in the widget's font."""
+        size = self._static_text.size()
+        return QSize(int(size.width()) + 4, int(size.height()) + 4)
+    
+    def minimumSizeHint(self):
+        """Allow the label to shrink horizontally."""
+        return QSize(0, self.sizeHint().height())
+    
+    def paintEvent(self, event):
+        """Draw the cached text."""
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        
+        text_width = self._static_text.size().width()
+        if self._alignment & Qt.AlignmentFlag.AlignHCenter:
+            x = (self.width() - text_width) / 2
+        elif self._alignment & Qt.AlignmentFlag.AlignRight:
+            x = self.width() - text_width
+        else:
+            x = 0
+        y = (self.height() - self._static_text.size().height()) / 2
+        
+        painter.drawStaticText(QPointF(max(x, 0), max(y, 0)), self._static_text)
+        painter.end()
@@ -2,18 +2,20 @@
 Video ROI configurator widget for drag-and-drop region of interest setup.
 """
 
-import cv2
-import numpy as np
-import glob
 import os
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QSlider, QFileDialog, QMessageBox,
                             QFrame, QSizePolicy)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRect
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QBrush, QColor, QImage, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QRect
+from PyQt6.QtGui import QPixmap, QPainter, QPicture, QPen, QBrush, QColor, QImage, QFont
 
 from desktop_app.gui.utils.config_manager import ConfigManager
+from desktop_app.gui.utils.screenshot_detector import ScreenshotDetector
+from desktop_app.workers.video_decoder import VideoDecoderWorker
+
+# cv2 is imported only in the decoder thread so building the main window
+# doesn't pay for loading it
 
 
 class VideoDisplayWidget(QLabel):
@@ -27,21 +29,41 @@ class VideoDisplayWidget(QLabel):
         self.setStyleSheet("border: 1px solid gray; background-color: #f0f0f0;")
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setText("Load a video to configure ROI regions")
-        self.setScaledContents(True)
+        # update_display already scales the frame to fit, so QLabel mustn't
+        # resample it a second time. Ignoring the pixmap's size hint keeps
+        # the fitted pixmap from growing the label on every resize.
+        self.setScaledContents(False)
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         
         # Dragging state
         self.dragging = False
         self.drag_start = None
         self.current_roi_type = None
         self.current_pixmap = None
-        
-        # ROI rectangles
+        # current_pixmap scaled to the widget, reused while only ROIs change
+        self._scaled_base = None
+        self._scaled_base_key = None  # (size, transformation mode)
+        # ROI overlays at the scaled frame's size, painted over it in paintEvent
+        self._overlay = None
+        self._overlay_key = None  # (killfeed ROI, chat ROI) drawn into _overlay
+        # Widget -> frame mapping for the scaled frame, updated when it is rescaled
+        self._frame_x = 0
+        self._frame_y = 0
+        self._scale_x = 1.0
+        self._scale_y = 1.0
+        
+        # ROI rectangles, in frame coordinates
         self.killfeed_roi = None
         self.chat_roi = None
+        # roi_type -> (coordinates, QPicture) of the recorded overlay
+        self._roi_pictures = {}
         
     def set_pixmap(self, pixmap):
         """Set video frame with ROI overlays."""
+        if self.current_pixmap is None:
+            self.clear()  # Drop the placeholder text
         self.current_pixmap = pixmap
+        self._scaled_base = None
         self.update_display()
         
     def update_display(self):
@@ -49,22 +71,105 @@ class VideoDisplayWidget(QLabel):
         if self.current_pixmap is None:
             return
             
-        # Create a copy of the pixmap for drawing
-        display_pixmap = self.current_pixmap.copy()
-        painter = QPainter(display_pixmap)
+        # Scale the frame only when it or the widget size changed; dragging an
+        # ROI just repaints the overlay layer. Frames arriving mid-drag (e.g.
+        # during playback) get the cheaper scaling.
+        if self.dragging:
+            mode = Qt.TransformationMode.FastTransformation
+        else:
+            mode = Qt.TransformationMode.SmoothTransformation
+        key = (self.contentsRect().size(), mode)
+        if self._scaled_base is None or (self._scaled_base_key != key and not self.dragging):
+            self._scaled_base = self.current_pixmap.scaled(key[0], Qt.AspectRatioMode.KeepAspectRatio, mode)
+            self._scaled_base_key = key
+            self._update_frame_mapping()
+        
+        self._update_overlay()
+        
+        # paintEvent draws the frame and the overlay layer directly, so the
+        # frame is never copied just to draw the ROIs on it
+        self.update()
+        
+    def _update_frame_mapping(self):
+        """Cache where the scaled frame sits in the label and its scale."""
+        contents = self.contentsRect()
+        self._frame_x = contents.x() + (contents.width() - self._scaled_base.width()) // 2
+        self._frame_y = contents.y() + (contents.height() - self._scaled_base.height()) // 2
+        self._scale_x = self.current_pixmap.width() / max(1, self._scaled_base.width())
+        self._scale_y = self.current_pixmap.height() / max(1, self._scaled_base.height())
+        
+    def _to_frame(self, pos):
+        """Map a widget position to frame coordinates, clamped to the frame."""
+        x = int((pos.x() - self._frame_x) * self._scale_x)
+        y = int((pos.y() - self._frame_y) * self._scale_y)
+        return (min(max(x, 0), self.current_pixmap.width()),
+                min(max(y, 0), self.current_pixmap.height()))
+        
+    def _update_overlay(self):
+        """Repaint the overlay layer if the ROIs or the frame size changed."""
+        size = self._scaled_base.size()
+        if self._overlay is None or self._overlay.size() != size:
+            self._overlay = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+            self._overlay_key = None
+        
+        key = (self.killfeed_roi and tuple(self.killfeed_roi),
+               self.chat_roi and tuple(self.chat_roi))
+        if key == self._overlay_key:
+            return
+        self._overlay_key = key
+        
+        self._overlay.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._overlay)
+        
+        # Overlays are in frame coordinates
+        painter.scale(1 / self._scale_x, 1 / self._scale_y)
         
         # Draw killfeed ROI
         if self.killfeed_roi:
-            self.draw_roi_overlay(painter, self.killfeed_roi, "Killfeed", QColor(255, 0, 0, 100))
+            painter.drawPicture(0, 0, self._roi_picture("killfeed", self.killfeed_roi, "Killfeed", QColor(255, 0, 0, 100)))
         
         # Draw chat ROI
         if self.chat_roi:
-            self.draw_roi_overlay(painter, self.chat_roi, "Chat", QColor(0, 255, 0, 100))
+            painter.drawPicture(0, 0, self._roi_picture("chat", self.chat_roi, "Chat", QColor(0, 255, 0, 100)))
+        
+        painter.end()
+        
+    def paintEvent(self, event):
+        """Draw the scaled frame and the ROI overlay layer centred in the label."""
+        super().paintEvent(event)
+        if self._scaled_base is None:
+            return
+        
+        painter = QPainter(self)
+        painter.drawPixmap(self._frame_x, self._frame_y, self._scaled_base)
+        painter.drawImage(self._frame_x, self._frame_y, self._overlay)
+        painter.end()
         
+    def resizeEvent(self, event):
+        """Drop the scaled frame so the next update rescales it."""
+        super().resizeEvent(event)
+        self._scaled_base = None
+        if self.current_pixmap is not None:
+            self.update_display()
+        
+    def _roi_picture(self, roi_type, roi, label, color):
+        """Get the overlay for an ROI, recording it only when the ROI moved.
+        
+        Replaying a QPicture skips the pen, brush and font setup that
+        draw_roi_overlay would otherwise redo on every mouse move.
+        """
+        key = tuple(roi)
+        cached = self._roi_pictures.get(roi_type)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        picture = QPicture()
+        painter = QPainter(picture)
+        self.draw_roi_overlay(painter, roi, label, color)
         painter.end()
         
-        # Update display
-        self.setPixmap(display_pixmap.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        self._roi_pictures[roi_type] = (key, picture)
+        return picture
         
     def draw_roi_overlay(self, painter, roi, label, color):
         """Draw ROI rectangle with label."""
@@ -101,7 +206,7 @@ class VideoDisplayWidget(QLabel):
         """Start ROI dragging."""
         if event.button() == Qt.MouseButton.LeftButton and self.current_pixmap:
             self.dragging = True
-            self.drag_start = event.pos()
+            self.drag_start = self._to_frame(event.pos())
             
             # Determine which ROI to create based on click position
             # Top-right area = killfeed, bottom-left = chat
@@ -115,11 +220,11 @@ class VideoDisplayWidget(QLabel):
     def mouseMoveEvent(self, event):
         """Update ROI while dragging."""
         if self.dragging and self.current_roi_type and self.drag_start:
-            # Calculate ROI coordinates
-            x1 = min(self.drag_start.x(), event.pos().x())
-            y1 = min(self.drag_start.y(), event.pos().y())
-            x2 = max(self.drag_start.x(), event.pos().x())
-            y2 = max(self.drag_start.y(), event.pos().y())
+            # Calculate ROI coordinates, in frame pixels
+            start_x, start_y = self.drag_start
+            end_x, end_y = self._to_frame(event.pos())
+            x1, x2 = min(start_x, end_x), max(start_x, end_x)
+            y1, y2 = min(start_y, end_y), max(start_y, end_y)
             
             # Set ROI and emit signal
             self.set_roi(self.current_roi_type, [x1, y1, x2, y2])
@@ -128,11 +233,11 @@ class VideoDisplayWidget(QLabel):
     def mouseReleaseEvent(self, event):
         """Finish ROI dragging."""
         if self.dragging and self.current_roi_type and self.drag_start:
-            # Final ROI coordinates
-            x1 = min(self.drag_start.x(), event.pos().x())
-            y1 = min(self.drag_start.y(), event.pos().y())
-            x2 = max(self.drag_start.x(), event.pos().x())
-            y2 = max(self.drag_start.y(), event.pos().y())
+            # Final ROI coordinates, in frame pixels
+            start_x, start_y = self.drag_start
+            end_x, end_y = self._to_frame(event.pos())
+            x1, x2 = min(start_x, end_x), max(start_x, end_x)
+            y1, y2 = min(start_y, end_y), max(start_y, end_y)
             
             # Set final ROI
             self.set_roi(self.current_roi_type, [x1, y1, x2, y2])
@@ -141,6 +246,13 @@ class VideoDisplayWidget(QLabel):
         self.dragging = False
         self.drag_start = None
         self.current_roi_type = None
+        self._final_smooth_render()
+        
+    def _final_smooth_render(self):
+        """Redraw with smooth scaling if a drag left a fast-scaled frame."""
+        if self._scaled_base is not None and self._scaled_base_key[1] != Qt.TransformationMode.SmoothTransformation:
+            self._scaled_base = None
+            self.update_display()
 
 
 class VideoROIConfigurator(QWidget):
@@ -150,11 +262,14 @@ class VideoROIConfigurator(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.video_cap = None
+        self._decoder = None  # VideoDecoderWorker for the loaded video
+        self._video_path = None
+        self.is_playing = False
         self.current_frame = None
         self.current_frame_number = 0
         self.total_frames = 0
         self.fps = 30
+        self._updating_slider = False  # slider moved by playback, not the user
         self.config_manager = ConfigManager()
         
         # ROI rectangles
@@ -229,10 +344,6 @@ class VideoROIConfigurator(QWidget):
         self.reset_btn.clicked.connect(self.reset_roi)
         self.test_btn.clicked.connect(self.test_detection)
         
-        # Timer for video playback
-        self.play_timer = QTimer()
-        self.play_timer.timeout.connect(self.next_frame)
-        
     def auto_detect_video(self):
         """Find and load the first video from captures folder."""
         try:
@@ -243,7 +354,8 @@ class VideoROIConfigurator(QWidget):
                 QMessageBox.warning(self, "No Captures Folder", "Please set the captures folder in the file paths section first.")
                 return
                 
-            video_path = self.find_first_video(captures_folder)
+            newest = config.get('gui', {}).get('auto_detect_newest_video', False)
+            video_path = self.find_first_video(captures_folder, newest)
             
             if video_path:
                 self.load_video(video_path)
@@ -253,18 +365,10 @@ class VideoROIConfigurator(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Auto-detect Error", f"Failed to auto-detect video: {str(e)}")
     
-    def find_first_video(self, folder_path):
-        """Find the first video file in the given folder."""
-        if not os.path.exists(folder_path):
-            return None
-            
-        video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm']
-        for ext in video_extensions:
-            pattern = os.path.join(folder_path, f"**/*{ext}")
-            video_files = glob.glob(pattern, recursive=True)
-            if video_files:
-                return video_files[0]
-        return None
+    def find_first_video(self, folder_path, newest=False):
+        """Find the alphabetically first (or newest) video in the given folder."""
+        # One directory walk instead of a full recursive glob per extension
+        return ScreenshotDetector.find_first_video(folder_path, newest)
         
     def browse_video(self):
         """Open video file browser dialog."""
@@ -279,21 +383,50 @@ class VideoROIConfigurator(QWidget):
             self.load_video(file_path)
             
     def load_video(self, video_path):
-        """Load video and initialize player."""
+        """Load video and initialize player.
+        
+        The video is opened and decoded on a VideoDecoderWorker thread; the
+        controls are enabled once it reports the video as opened.
+        """
+        self.stop_decoder()
+        
+        self._video_path = video_path
+        self._decoder = VideoDecoderWorker(video_path)
+        self._decoder.video_opened.connect(self.on_video_opened)
+        self._decoder.open_failed.connect(self.on_video_open_failed)
+        self._decoder.frame_ready.connect(self.on_frame_ready)
+        self._decoder.playback_finished.connect(self.on_playback_finished)
+        self._decoder.start()
+        
+    def stop_decoder(self):
+        """Stop the decoder thread for the current video, if any."""
+        if self._decoder is None:
+            return
+        
+        self._decoder.stop()
+        self._decoder.wait()
+        self._decoder = None
+        self.is_playing = False
+        self.play_pause_btn.setText("▶️")
+        
+    def closeEvent(self, event):
+        """Stop the decoder thread when the configurator is closed."""
+        self.stop_decoder()
+        super().closeEvent(event)
+        
+    def on_video_opened(self, total_frames, fps):
+        """Enable the player controls for a newly opened video."""
+        if self.sender() is not self._decoder:
+            return
+        
+        self.total_frames = total_frames
+        self.fps = fps
+        
+        # Repaint once after all the control changes below
+        self.setUpdatesEnabled(False)
         try:
-            self.video_cap = cv2.VideoCapture(video_path)
-            if not self.video_cap.isOpened():
-                QMessageBox.critical(self, "Video Error", f"Could not open video file: {video_path}")
-                return
-                
-            self.total_frames = int(self.video_cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            self.fps = self.video_cap.get(cv2.CAP_PROP_FPS)
-            
-            if self.fps == 0:
-                self.fps = 30  # Default FPS
-                
             self.seek_slider.setMaximum(self.total_frames - 1)
-            self.video_path_label.setText(f"📹 {os.path.basename(video_path)}")
+            self.video_path_label.setText(f"📹 {os.path.basename(self._video_path)}")
             self.video_path_label.setStyleSheet("color: #000; font-weight: bold;")
             
             # Enable controls
@@ -303,28 +436,48 @@ class VideoROIConfigurator(QWidget):
             self.test_btn.setEnabled(True)
             
             # Load first frame
-            self.seek_to_frame(0)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Video Error", f"Failed to load video: {str(e)}")
+            self._decoder.seek(0)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+    def on_video_open_failed(self, message):
+        """Report a video that could not be opened."""
+        if self.sender() is not self._decoder:
+            return
+        
+        # The thread is already finishing; let it exit before dropping it
+        decoder, self._decoder = self._decoder, None
+        decoder.wait()
+        QMessageBox.critical(self, "Video Error", message)
             
     def seek_to_frame(self, frame_number):
         """Seek to specific frame and display it."""
-        if not self.video_cap:
+        if self._decoder is None or self._updating_slider:
             return
-            
+        
+        # The decoder keeps only the latest seek, so scrubbing the slider
+        # doesn't queue up a decode per intermediate position
+        self._decoder.seek(frame_number)
+        
+    def on_frame_ready(self, frame, frame_number):
+        """Display a frame delivered by the decoder."""
+        decoder = self.sender()
+        if decoder is not self._decoder:
+            return
+        
+        self.current_frame = frame
+        self.current_frame_number = frame_number
+        
+        # Move the slider without triggering a seek back to this frame
+        self._updating_slider = True
         try:
-            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = self.video_cap.read()
-            
-            if ret:
-                self.current_frame = frame
-                self.current_frame_number = frame_number
-                self.update_display()
-                self.update_time_label()
-                
-        except Exception as e:
-            print(f"Error seeking to frame: {e}")
+            self.seek_slider.setValue(frame_number)
+        finally:
+            self._updating_slider = False
+        
+        self.update_display()
+        self.update_time_label()
+        decoder.frame_consumed()
             
     def update_display(self):
         """Update the video display with current frame and ROI overlays."""
@@ -332,13 +485,11 @@ class VideoROIConfigurator(QWidget):
             return
             
         try:
-            # Convert BGR to RGB for Qt
-            frame_rgb = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-            height, width, channel = frame_rgb.shape
-            bytes_per_line = 3 * width
-            
-            # Create QImage
-            q_image = QImage(frame_rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
+            # Wrap the BGR frame directly; no RGB copy is needed. fromImage
+            # copies the pixels, so the QImage only has to live until then.
+            frame = self.current_frame
+            height, width = frame.shape[:2]
+            q_image = QImage(frame.data, width, height, frame.strides[0], QImage.Format.Format_BGR888)
             pixmap = QPixmap.fromImage(q_image)
             
             # Update display with ROI overlays
@@ -360,21 +511,25 @@ class VideoROIConfigurator(QWidget):
             
     def toggle_play_pause(self):
         """Toggle video playback."""
-        if self.play_timer.isActive():
-            self.play_timer.stop()
-            self.play_pause_btn.setText("▶️")
-        else:
-            self.play_timer.start(int(1000 / self.fps))
+        if self._decoder is None:
+            return
+        
+        self.is_playing = not self.is_playing
+        if self.is_playing:
+            self._decoder.play()
             self.play_pause_btn.setText("⏸️")
-            
-    def next_frame(self):
-        """Advance to next frame during playback."""
-        if self.current_frame_number < self.total_frames - 1:
-            self.seek_to_frame(self.current_frame_number + 1)
         else:
-            self.play_timer.stop()
+            self._decoder.pause()
             self.play_pause_btn.setText("▶️")
             
+    def on_playback_finished(self):
+        """Reset the play button when the decoder reaches the end."""
+        if self.sender() is not self._decoder:
+            return
+        
+        self.is_playing = False
+        self.play_pause_btn.setText("▶️")
+            
     def on_roi_dragged(self, roi_type, coordinates):
         """Handle ROI drag events from video display."""
         if roi_type == "killfeed":
@@ -435,7 +590,8 @@ class VideoROIConfigurator(QWidget):
         
     def test_detection(self):
         """Test ROI detection on current frame."""
-        if not self.current_frame or not self.killfeed_roi or not self.chat_roi:
+        # current_frame is an ndarray, so it must be compared with None
+        if self.current_frame is None or not self.killfeed_roi or not self.chat_roi:
             QMessageBox.warning(self, "Test Error", "Please configure both ROI regions first")
             return None
             
@@ -448,11 +604,11 @@ class VideoROIConfigurator(QWidget):
             results = {
                 'killfeed': {
                     'size': killfeed_crop.shape,
-                    'mean_color': np.mean(killfeed_crop, axis=(0, 1)).tolist()
+                    'mean_color': killfeed_crop.mean(axis=(0, 1)).tolist()
                 },
                 'chat': {
                     'size': chat_crop.shape,
-                    'mean_color': np.mean(chat_crop, axis=(0, 1)).tolist()
+                    'mean_color': chat_crop.mean(axis=(0, 1)).tolist()
                 }
             }
             
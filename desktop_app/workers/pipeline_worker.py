@@ -2,9 +2,10 @@
 Background worker for executing the CHAOS processing pipeline.
 """
 
+import asyncio
+import codecs
 import sys
-import os
-import subprocess
+import threading
 import time
 from pathlib import Path
 from PyQt6.QtCore import QThread, pyqtSignal
@@ -15,8 +16,85 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from chaos_lib import ingestion, analyzers, correlator, clipper, summary
+from chaos_lib.utils import ensure_dirs
 from desktop_app.gui.utils.config_manager import ConfigManager
 
+# Minimum seconds between log batches sent to the GUI (~30 Hz)
+_LOG_BATCH_INTERVAL = 1 / 30
+
+# PipelineWorker sends buffered log messages after this many seconds or lines
+_LOG_FLUSH_SECONDS = 0.05
+_LOG_FLUSH_LINES = 64
+
+# stage -> stages whose output it reads. clip and summary both only read the
+# correlator's highlights, so they can run at the same time.
+_STAGE_DEPENDENCIES = {
+    "ingest": (),
+    "analyze": ("ingest",),
+    "correlate": ("analyze",),
+    "clip": ("correlate",),
+    "summary": ("correlate",),
+}
+
+
+def _upstream(stage: str) -> set:
+    """All stages whose output stage reads, directly or indirectly."""
+    found = set()
+    pending = list(_STAGE_DEPENDENCIES.get(stage, ()))
+    while pending:
+        dep = pending.pop()
+        if dep not in found:
+            found.add(dep)
+            pending.extend(_STAGE_DEPENDENCIES.get(dep, ()))
+    return found
+
+
+def _group_stages(stages: List[str]) -> List[List[str]]:
+    """Split stages, in order, into groups whose members can run concurrently.
+    
+    A stage joins the current group only if neither it nor any member of the
+    group reads the other's output; unknown stages always run on their own.
+    """
+    groups = []
+    for stage in stages:
+        group = groups[-1] if groups else None
+        if (group is not None and stage in _STAGE_DEPENDENCIES
+                and all(member in _STAGE_DEPENDENCIES for member in group)
+                and not any(member in _upstream(stage) or stage in _upstream(member)
+                            for member in group)):
+            group.append(stage)
+        else:
+            groups.append([stage])
+    return groups
+
+
+# One ConfigManager per config path, shared by all workers so its parsed
+# config and validation results are reused from run to run
+_config_managers: Dict[str, ConfigManager] = {}
+
+
+def _shared_config_manager(config_path: str) -> ConfigManager:
+    """Return the ConfigManager shared by workers using config_path."""
+    manager = _config_managers.get(config_path)
+    if manager is None:
+        manager = _config_managers[config_path] = ConfigManager(config_path)
+    return manager
+
+
+# stage -> (start messages, stage function, completion message)
+_STAGES = {
+    "ingest": (("Creating video manifest...",),
+               ingestion.create_manifest, "Video manifest created successfully"),
+    "analyze": (("Starting video analysis...", "Initializing AI models (EasyOCR & Whisper)..."),
+                analyzers.run_analysis, "Video analysis completed"),
+    "correlate": (("Correlating events and scoring clips...",),
+                  correlator.run_correlation, "Event correlation completed"),
+    "clip": (("Generating video clips...",),
+             clipper.run_clipping, "Video clipping completed"),
+    "summary": (("Generating summary...",),
+                summary.generate_summary, "Summary generation completed"),
+}
+
 
 class PipelineWorker(QThread):
     """Background worker for pipeline execution."""
@@ -26,6 +104,7 @@ class PipelineWorker(QThread):
     stage_started = pyqtSignal(str)  # stage_name
     stage_completed = pyqtSignal(str, bool)  # stage_name, success
     log_message = pyqtSignal(str)  # log_message
+    log_message_batch = pyqtSignal(list)  # log messages from the worker thread
     error_occurred = pyqtSignal(str)  # error_message
     finished = pyqtSignal(bool)  # overall_success
     
@@ -33,18 +112,26 @@ class PipelineWorker(QThread):
         super().__init__()
         self.stages = stages
         self.config_path = config_path or str(project_root / "config.yaml")
-        self.config_manager = ConfigManager(self.config_path)
+        self.config_manager = _shared_config_manager(self.config_path)
         self.is_paused = False
         self.should_stop = False
+        # Cleared while paused; the stage loop blocks on it between stages
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        # Log messages not yet sent to the GUI, see _emit_log
+        self._log_buf = []
+        self._last_flush = 0.0
+        self._log_lock = threading.Lock()  # stages of a group log concurrently
         
     def run(self):
         """Execute the pipeline stages."""
         try:
-            self.log_message.emit("Starting CHAOS pipeline execution...")
+            self._emit_log("Starting CHAOS pipeline execution...")
             
             # Load configuration
             config = self.config_manager.load_config()
             if not config:
+                self._flush_logs()
                 self.error_occurred.emit("Failed to load configuration")
                 self.finished.emit(False)
                 return
@@ -52,108 +139,137 @@ class PipelineWorker(QThread):
             # Validate configuration
             errors = self.config_manager.validate_config(config)
             if errors:
+                self._flush_logs()
                 self.error_occurred.emit(f"Configuration errors: {'; '.join(errors)}")
                 self.finished.emit(False)
                 return
             
             # Ensure output directories exist
-            os.makedirs(config['data_folder'], exist_ok=True)
-            os.makedirs(config['final_clips_folder'], exist_ok=True)
+            ensure_dirs((config['data_folder'], config['final_clips_folder']))
             
             total_stages = len(self.stages)
             overall_success = True
+            done = 0
             
-            for i, stage in enumerate(self.stages):
+            for group in _group_stages(self.stages):
                 if self.should_stop:
-                    self.log_message.emit("Pipeline execution stopped by user")
+                    self._emit_log("Pipeline execution stopped by user")
                     break
                 
-                # Wait if paused
-                while self.is_paused and not self.should_stop:
-                    time.sleep(0.1)
+                # Wait if paused; stop() also releases the wait
+                self._flush_logs()
+                self._resume_event.wait()
                 
                 if self.should_stop:
                     break
                 
                 # Calculate progress
-                progress = int((i / total_stages) * 100)
-                self.progress_updated.emit(progress, f"Starting {stage} stage...")
-                self.stage_started.emit(stage)
+                progress = int((done / total_stages) * 100)
+                self._flush_logs()
+                self.progress_updated.emit(progress, f"Starting {' + '.join(group)} stage...")
+                for stage in group:
+                    self.stage_started.emit(stage)
                 
-                # Execute stage
-                success = self.execute_stage(stage, config)
-                self.stage_completed.emit(stage, success)
+                # Execute stages; independent ones run side by side
+                if len(group) == 1:
+                    results = [self.execute_stage(group[0], config)]
+                else:
+                    results = asyncio.run(self._execute_concurrently(group, config))
+                done += len(group)
                 
-                if not success:
+                self._flush_logs()
+                for stage, success in zip(group, results):
+                    self.stage_completed.emit(stage, success)
+                
+                failed = [stage for stage, success in zip(group, results) if not success]
+                if failed:
                     overall_success = False
-                    self.error_occurred.emit(f"Stage '{stage}' failed")
+                    for stage in failed:
+                        self.error_occurred.emit(f"Stage '{stage}' failed")
                     break
                 
-                self.log_message.emit(f"Stage '{stage}' completed successfully")
+                for stage in group:
+                    self._emit_log(f"Stage '{stage}' completed successfully")
             
             # Final progress update
             if not self.should_stop:
+                self._flush_logs()
                 self.progress_updated.emit(100, "Pipeline execution completed!")
-                self.log_message.emit("CHAOS pipeline execution finished")
+                self._emit_log("CHAOS pipeline execution finished")
             
+            self._flush_logs()
             self.finished.emit(overall_success and not self.should_stop)
             
         except Exception as e:
+            self._flush_logs()
             self.error_occurred.emit(f"Pipeline execution failed: {str(e)}")
             self.finished.emit(False)
     
     def execute_stage(self, stage: str, config: Dict[str, Any]) -> bool:
         """Execute a specific pipeline stage."""
         try:
-            if stage == "ingest":
-                self.log_message.emit("Creating video manifest...")
-                ingestion.create_manifest(config)
-                self.log_message.emit("Video manifest created successfully")
-                
-            elif stage == "analyze":
-                self.log_message.emit("Starting video analysis...")
-                self.log_message.emit("Initializing AI models (EasyOCR & Whisper)...")
-                analyzers.run_analysis(config)
-                self.log_message.emit("Video analysis completed")
-                
-            elif stage == "correlate":
-                self.log_message.emit("Correlating events and scoring clips...")
-                correlator.run_correlation(config)
-                self.log_message.emit("Event correlation completed")
-                
-            elif stage == "clip":
-                self.log_message.emit("Generating video clips...")
-                clipper.run_clipping(config)
-                self.log_message.emit("Video clipping completed")
-                
-            elif stage == "summary":
-                self.log_message.emit("Generating summary...")
-                summary.generate_summary(config)
-                self.log_message.emit("Summary generation completed")
-                
-            else:
-                self.log_message.emit(f"Unknown stage: {stage}")
+            entry = _STAGES.get(stage)
+            if entry is None:
+                self._emit_log(f"Unknown stage: {stage}")
                 return False
             
+            start_messages, run_stage, done_message = entry
+            for message in start_messages:
+                self._emit_log(message)
+            # Stages can run for a long time; show what is running first
+            self._flush_logs()
+            
+            run_stage(config)
+            self._emit_log(done_message)
             return True
             
         except Exception as e:
-            self.log_message.emit(f"Error in {stage} stage: {str(e)}")
+            self._emit_log(f"Error in {stage} stage: {str(e)}")
             return False
     
+    async def _execute_concurrently(self, stages: List[str], config: Dict[str, Any]) -> List[bool]:
+        """Run independent stages on separate threads and wait for all of them."""
+        return await asyncio.gather(*(asyncio.to_thread(self.execute_stage, stage, config)
+                                      for stage in stages))
+    
+    def _emit_log(self, message: str):
+        """Buffer a log message, sending the buffer if it is due.
+        
+        Messages go out in batches through log_message_batch, at most every
+        _LOG_FLUSH_SECONDS unless _LOG_FLUSH_LINES pile up. Call _flush_logs
+        before any other signal so the GUI sees events in order.
+        """
+        with self._log_lock:
+            self._log_buf.append(message)
+            due = (len(self._log_buf) >= _LOG_FLUSH_LINES
+                   or time.monotonic() - self._last_flush >= _LOG_FLUSH_SECONDS)
+        if due:
+            self._flush_logs()
+    
+    def _flush_logs(self):
+        """Send all buffered log messages to the GUI."""
+        with self._log_lock:
+            batch, self._log_buf = self._log_buf, []
+            self._last_flush = time.monotonic()
+        if batch:
+            self.log_message_batch.emit(batch)
+    
     def pause(self):
         """Pause pipeline execution."""
         self.is_paused = True
+        self._resume_event.clear()
         self.log_message.emit("Pipeline execution paused")
     
     def resume(self):
         """Resume pipeline execution."""
         self.is_paused = False
+        self._resume_event.set()
         self.log_message.emit("Pipeline execution resumed")
     
     def stop(self):
         """Stop pipeline execution."""
         self.should_stop = True
+        self._resume_event.set()
         self.log_message.emit("Stopping pipeline execution...")
 
 
@@ -162,6 +278,7 @@ class CommandLineWorker(QThread):
     
     progress_updated = pyqtSignal(int, str)
     log_message = pyqtSignal(str)
+    log_message_batch = pyqtSignal(list)  # lines of command output
     error_occurred = pyqtSignal(str)
     finished = pyqtSignal(bool)
     
@@ -170,6 +287,9 @@ class CommandLineWorker(QThread):
         self.stages = stages
         self.config_path = config_path or str(project_root / "config.yaml")
         self.should_stop = False
+        # Event loop and stop event of the running command, for stop()
+        self._loop = None
+        self._stop_event = None
         
     def run(self):
         """Execute pipeline using command-line interface."""
@@ -182,40 +302,26 @@ class CommandLineWorker(QThread):
             else:
                 stage_arg = self.stages[0]  # Run first stage for now
             
-            # Build command
+            # Build command; -u so the child's prints reach the pipe as they
+            # happen instead of in block-buffered lumps
             cmd = [
                 sys.executable,
+                "-u",
                 str(project_root / "main.py"),
                 stage_arg
             ]
             
             self.log_message.emit(f"Executing command: {' '.join(cmd)}")
             
-            # Execute command
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Read output line by line
-            while True:
-                if self.should_stop:
-                    process.terminate()
-                    break
-                
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                
-                if output:
-                    self.log_message.emit(output.strip())
-            
-            # Wait for process to complete
-            return_code = process.wait()
+            # Execute command on an event loop owned by this thread, so output
+            # is streamed as it arrives and stop() can interrupt at any time
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            try:
+                return_code = loop.run_until_complete(self._run_command(cmd))
+            finally:
+                self._loop = None
+                loop.close()
             
             if return_code == 0:
                 self.progress_updated.emit(100, "Pipeline completed successfully")
@@ -228,6 +334,91 @@ class CommandLineWorker(QThread):
             self.error_occurred.emit(f"Command execution failed: {str(e)}")
             self.finished.emit(False)
     
+    async def _run_command(self, cmd: List[str]) -> int:
+        """Run cmd, forwarding its output until it exits or a stop is requested.
+        
+        Returns:
+            The process return code.
+        """
+        self._stop_event = asyncio.Event()
+        if self.should_stop:
+            self._stop_event.set()
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1 << 20
+        )
+        
+        reader = asyncio.ensure_future(self._forward_output(process.stdout))
+        stopper = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            done, _ = await asyncio.wait({reader, stopper}, return_when=asyncio.FIRST_COMPLETED)
+            if stopper in done:
+                process.terminate()
+            return await process.wait()
+        finally:
+            stopper.cancel()
+            reader.cancel()
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+            self._stop_event = None
+    
+    async def _forward_output(self, stream: asyncio.StreamReader):
+        """Forward the command's output as batches of lines.
+        
+        Output is read in chunks and emitted through log_message_batch at
+        most every _LOG_BATCH_INTERVAL seconds, so a chatty command costs
+        one signal per batch instead of one per line. Carriage returns
+        (progress bars) end a line like newlines do; blank lines are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        partial = ""
+        batch = []
+        last_emit = loop.time()
+        
+        while True:
+            # With lines waiting, only wait for more output until they're due
+            timeout = None
+            if batch:
+                timeout = max(0.0, last_emit + _LOG_BATCH_INTERVAL - loop.time())
+            try:
+                chunk = await asyncio.wait_for(stream.read(16384), timeout)
+            except asyncio.TimeoutError:
+                chunk = None
+            
+            if chunk:
+                lines = (partial + decoder.decode(chunk)).replace('\r', '\n').split('\n')
+                partial = lines.pop()
+                batch.extend(line.strip() for line in lines if line.strip())
+            elif chunk is not None:
+                # End of output
+                tail = (partial + decoder.decode(b'', final=True)).strip()
+                if tail:
+                    batch.append(tail)
+                if batch:
+                    self.log_message_batch.emit(batch)
+                return
+            
+            if batch and loop.time() - last_emit >= _LOG_BATCH_INTERVAL:
+                self.log_message_batch.emit(batch)
+                batch = []
+                last_emit = loop.time()
+    
+    def _request_stop(self):
+        """Wake _run_command; runs on the worker's event loop."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
     def stop(self):
         """Stop command execution."""
         self.should_stop = True
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._request_stop)
+            except RuntimeError:
+                pass  # Loop already closed
@@ -0,0 +1,182 @@
+"""
+Background worker for decoding video frames off the GUI thread.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from PyQt6.QtCore import QThread, pyqtSignal
+
+# Memory budget for frames kept around for repeat seeks
+_SEEK_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _open_capture(video_path: str):
+    """Open a VideoCapture, preferring hardware-accelerated decoding.
+    
+    Asks the FFmpeg backend for any available accelerator (NVDEC, VAAPI,
+    QuickSync, ...) and falls back to the default software path if that
+    fails or this OpenCV build doesn't support the option (4.5.2+).
+    """
+    import cv2
+    
+    hw_prop = getattr(cv2, 'CAP_PROP_HW_ACCELERATION', None)
+    hw_any = getattr(cv2, 'VIDEO_ACCELERATION_ANY', None)
+    if hw_prop is not None and hw_any is not None:
+        try:
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [hw_prop, hw_any])
+            if cap.isOpened():
+                return cap
+            cap.release()
+        except cv2.error:
+            pass
+    
+    return cv2.VideoCapture(video_path)
+
+
+class VideoDecoderWorker(QThread):
+    """Owns a cv2.VideoCapture and decodes frames on request.
+    
+    Seek requests are coalesced: while the thread is busy, only the most
+    recent one is kept, so scrubbing a slider never queues up stale seeks.
+    During playback, frames the GUI hasn't picked up yet are dropped rather
+    than queued, so the display stays in real time even if painting lags.
+    Recently seeked frames are kept in a small LRU cache, so scrubbing back
+    and forth over the same positions doesn't decode them again.
+    """
+    
+    # Signals
+    video_opened = pyqtSignal(int, float)  # total_frames, fps
+    open_failed = pyqtSignal(str)  # error_message
+    frame_ready = pyqtSignal(object, int)  # frame (BGR ndarray), frame_number
+    playback_finished = pyqtSignal()
+    
+    def __init__(self, video_path: str):
+        super().__init__()
+        self.video_path = video_path
+        self.fps = 30.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._consumed = threading.Event()
+        self._consumed.set()
+        self._seek_to = None
+        self._playing = False
+        self._seek_cache = OrderedDict()  # frame_number -> frame
+        self._seek_cache_bytes = 0
+        self.should_stop = False
+    
+    def run(self):
+        """Open the video and serve seek/playback requests until stopped."""
+        import cv2
+        
+        cap = _open_capture(self.video_path)
+        if not cap.isOpened():
+            self.open_failed.emit(f"Could not open video file: {self.video_path}")
+            return
+        
+        try:
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self.fps = cap.get(cv2.CAP_PROP_FPS) or 30.0  # Default FPS
+            self.video_opened.emit(total_frames, self.fps)
+            
+            interval = 1.0 / self.fps
+            position = -1  # frame number of the last frame read
+            resync = False  # cap is not positioned just after position
+            next_due = 0.0
+            
+            while not self.should_stop:
+                with self._lock:
+                    target = self._seek_to
+                    self._seek_to = None
+                    playing = self._playing
+                
+                if target is not None:
+                    frame = self._seek_cache.get(target)
+                    if frame is not None:
+                        self._seek_cache.move_to_end(target)
+                        position = target
+                        resync = True
+                        self._emit_frame(frame, position)
+                    else:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                        ret, frame = cap.read()
+                        if ret:
+                            position = target
+                            resync = False
+                            self._cache_frame(frame, position)
+                            self._emit_frame(frame, position)
+                    next_due = time.monotonic() + interval
+                    continue
+                
+                if not playing:
+                    # Idle until the next request
+                    self._wake.wait()
+                    self._wake.clear()
+                    next_due = time.monotonic() + interval
+                    continue
+                
+                # Pace playback; a new request cuts the wait short
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    if self._wake.wait(delay):
+                        self._wake.clear()
+                        continue
+                next_due = max(next_due + interval, time.monotonic())
+                
+                # Sequential read: no keyframe seek between playback frames,
+                # unless the last seek was served from the cache
+                if resync:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, position + 1)
+                    resync = False
+                ret, frame = cap.read()
+                if not ret:
+                    with self._lock:
+                        self._playing = False
+                    self.playback_finished.emit()
+                    continue
+                
+                position += 1
+                if self._consumed.is_set():
+                    self._emit_frame(frame, position)
+        finally:
+            cap.release()
+    
+    def _cache_frame(self, frame, frame_number):
+        """Keep a seeked frame for repeat visits, evicting the oldest first."""
+        self._seek_cache[frame_number] = frame
+        self._seek_cache_bytes += frame.nbytes
+        while self._seek_cache_bytes > _SEEK_CACHE_BYTES and len(self._seek_cache) > 1:
+            _, evicted = self._seek_cache.popitem(last=False)
+            self._seek_cache_bytes -= evicted.nbytes
+    
+    def _emit_frame(self, frame, frame_number):
+        """Hand a frame to the GUI and mark it as in flight."""
+        self._consumed.clear()
+        self.frame_ready.emit(frame, frame_number)
+    
+    def frame_consumed(self):
+        """Tell the worker the GUI has displayed the last frame it sent."""
+        self._consumed.set()
+    
+    def seek(self, frame_number: int):
+        """Request the frame at frame_number, replacing any pending seek."""
+        with self._lock:
+            self._seek_to = frame_number
+        self._wake.set()
+    
+    def play(self):
+        """Start decoding frames sequentially at the video's frame rate."""
+        with self._lock:
+            self._playing = True
+        self._wake.set()
+    
+    def pause(self):
+        """Stop sequential playback."""
+        with self._lock:
+            self._playing = False
+        self._wake.set()
+    
+    def stop(self):
+        """Stop the worker thread."""
+        self.should_stop = True
+        self._wake.set()
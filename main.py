@@ -1,13 +1,155 @@
 # === FILE: main_robust.py ===
 import argparse
+import multiprocessing
 import yaml
 import os
 import json
+import mmap
+import queue
+import threading
 import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from chaos_lib import ingestion, analyzers, correlator, clipper, summary
+from chaos_lib.utils import ensure_dirs
+
+# Prefer the libyaml-backed loader, falling back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson is optional; the stdlib json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is optional; used to read the binary event files analysis writes
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def _json_loads(data):
+    """Parse JSON from bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize obj to compact JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+@lru_cache(maxsize=4)
+def _load_yaml_cached(path, mtime_ns):
+    """Parse a YAML file; mtime_ns keys the cache so edits are picked up.
+    
+    The result is shared between callers; treat it as read-only.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+def _read_bytes_if_exists(path):
+    """Return the contents of path, or None if it doesn't exist."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def _read_events_if_exists(events_path):
+    """Load a video's events, or None if it has no events file.
+    
+    Prefers the msgpack copy written next to the JSON file, read through
+    mmap, as long as it is at least as new as the JSON file.
+    """
+    if msgpack is not None:
+        packed_path = os.path.splitext(events_path)[0] + '.msgpack'
+        try:
+            if os.stat(packed_path).st_mtime_ns >= os.stat(events_path).st_mtime_ns:
+                with open(packed_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as packed:
+                    return msgpack.unpackb(packed, raw=False)
+        except (OSError, ValueError):
+            pass  # Missing, empty or unreadable; use the JSON file
+    
+    data = _read_bytes_if_exists(events_path)
+    return _json_loads(data) if data is not None else None
+
+def _analyze_video(config, video_path, use_gpu=False):
+    """Analyze one video into its own data folder.
+    
+    Module-level so it can run in a worker process. It only touches the
+    video's own folder; the caller records the outcome in the progress file.
+    
+    Returns:
+        (video_config, None) on success, otherwise (None, error message).
+    """
+    video_name = os.path.basename(video_path)
+    print(f'\n Processing: {video_name}')
+    
+    try:
+        video_config = config.copy()
+        video_config['debug_mode'] = False
+        video_config['use_gpu'] = use_gpu
+        
+        video_data_folder = os.path.join(config['data_folder'], 'videos', 
+                                       os.path.splitext(video_name)[0])
+        ensure_dirs((video_data_folder,))
+        video_config['data_folder'] = video_data_folder
+        
+        # The video is passed directly instead of through a one-entry manifest.
+        # Models are loaded by the first video this process analyzes and
+        # reused for the rest; each pool worker process keeps its own.
+        print(f'   Analyzing {video_name}...')
+        analyzers.run_analysis(video_config, video_paths=[video_path])
+        return video_config, None
+        
+    except Exception as e:
+        error_message = str(e)
+        print(f'   Failed: {video_name} - {error_message}')
+        return None, error_message
+
+def _correlate_and_clip_video(video_config, video_path):
+    """Correlate and clip a video already analyzed by _analyze_video.
+    
+    Returns:
+        None on success, otherwise the error message.
+    """
+    video_name = os.path.basename(video_path)
+    
+    try:
+        print(f'   Correlating events for {video_name}...')
+        correlator.run_correlation(video_config)
+        
+        print(f'    Clipping {video_name}...')
+        clipper.run_clipping(video_config)
+        
+        print(f'   Completed: {video_name}')
+        return None
+        
+    except Exception as e:
+        error_message = str(e)
+        print(f'   Failed: {video_name} - {error_message}')
+        return error_message
+
+def _process_single_video(config, video_path, use_gpu=False):
+    """Analyze, correlate and clip one video into its own data folder.
+    
+    Returns:
+        None on success, otherwise the error message.
+    """
+    video_config, error_message = _analyze_video(config, video_path, use_gpu)
+    if error_message is not None:
+        return error_message
+    return _correlate_and_clip_video(video_config, video_path)
 
 class RobustPipeline:
     def __init__(self, config_path='config.yaml'):
@@ -15,15 +157,19 @@ class RobustPipeline:
         self.load_config()
         self.progress_file = os.path.join(self.config['data_folder'], 'processing_progress.json')
         self.progress = self.load_progress()
+        # Per-video saves are throttled; _dirty marks changes not yet written
+        self._last_save = 0.0
+        self._dirty = False
+        # Manifest contents, read once; reset when ingestion rewrites it
+        self._all_videos = None
         
     def load_config(self):
-        with open(self.config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_yaml_cached(self.config_path, os.stat(self.config_path).st_mtime_ns)
             
     def load_progress(self):
         if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                return json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                return _json_loads(f.read())
         return {
             'ingestion_completed': False,
             'rerunFailed': False,
@@ -35,10 +181,30 @@ class RobustPipeline:
             'last_update': None
         }
     
-    def save_progress(self):
+    def save_progress(self, force=False):
+        """Write the progress file, at most once every 2 seconds unless forced.
+        
+        Skipped saves leave _dirty set; flush_progress writes them out.
+        """
         self.progress['last_update'] = datetime.now().isoformat()
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        if not force and time.monotonic() - self._last_save < 2.0:
+            self._dirty = True
+            return
+        
+        # Write a temp file and rename it over the old one, so an interrupted
+        # save never leaves a truncated progress file behind
+        tmp_path = self.progress_file + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(self.progress))
+        os.replace(tmp_path, self.progress_file)
+        
+        self._last_save = time.monotonic()
+        self._dirty = False
+    
+    def flush_progress(self):
+        """Write out any progress whose save was throttled."""
+        if self._dirty:
+            self.save_progress(force=True)
     
     def run_ingestion(self):
         if self.progress['ingestion_completed']:
@@ -48,9 +214,10 @@ class RobustPipeline:
         print('\n--- Running Stage: Ingestion ---')
         try:
             ingestion.create_manifest(self.config)
+            self._all_videos = None
             self.progress['ingestion_completed'] = True
             self.progress['current_stage'] = 'analysis'
-            self.save_progress()
+            self.save_progress(force=True)
             print(' Ingestion completed successfully')
             return True
         except Exception as e:
@@ -58,17 +225,20 @@ class RobustPipeline:
             return False
     
     def get_video_list(self):
+        if self._all_videos is not None:
+            return self._all_videos
+        
         manifest_path = os.path.join(self.config['data_folder'], 'manifest.json')
         if not os.path.exists(manifest_path):
             print('No manifest found. Please run ingestion first.')
             return []
             
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
+        with open(manifest_path, 'rb') as f:
+            self._all_videos = tuple(_json_loads(f.read()))
+        return self._all_videos
     
     def get_unprocessed_videos(self, debug_mode=False, max_videos=None):
         all_videos = self.get_video_list()
-        processed = set(self.progress['videos_processed'])
         failed = set(self.progress['videos_failed'])
         
         # If rerunFailed is True, only include failed videos for reprocessing
@@ -76,7 +246,8 @@ class RobustPipeline:
             unprocessed = [v for v in all_videos if v in failed]
             print(f'Rerun failed mode: Processing only {len(unprocessed)} previously failed videos')
         else:
-            unprocessed = [v for v in all_videos if v not in processed and v not in failed]
+            done = failed.union(self.progress['videos_processed'])
+            unprocessed = [v for v in all_videos if v not in done]
         
         if debug_mode and max_videos is not None:
             unprocessed = unprocessed[:max_videos]
@@ -85,53 +256,28 @@ class RobustPipeline:
         return unprocessed
     
     def process_single_video(self, video_path, use_gpu=False):
-        video_name = os.path.basename(video_path)
-        print(f'\n Processing: {video_name}')
-        
-        try:
-            video_config = self.config.copy()
-            video_config['debug_mode'] = False
-            video_config['use_gpu'] = use_gpu
-            
-            video_data_folder = os.path.join(self.config['data_folder'], 'videos', 
-                                           os.path.splitext(video_name)[0])
-            os.makedirs(video_data_folder, exist_ok=True)
-            video_config['data_folder'] = video_data_folder
-            
-            video_manifest_path = os.path.join(video_data_folder, 'manifest.json')
-            with open(video_manifest_path, 'w') as f:
-                json.dump([video_path], f)
-            
-            print(f'   Analyzing {video_name}...')
-            analyzers.run_analysis(video_config)
-            
-            print(f'   Correlating events for {video_name}...')
-            correlator.run_correlation(video_config)
-            
-            print(f'    Clipping {video_name}...')
-            clipper.run_clipping(video_config)
-            
-            self.progress['videos_processed'].append(video_path)
-            
-            # If this video was previously failed, remove it from failed list and failure reasons
-            if video_path in self.progress['videos_failed']:
-                self.progress['videos_failed'].remove(video_path)
-                if video_path in self.progress['failure_reasons']:
-                    del self.progress['failure_reasons'][video_path]
-                print(f'   Previously failed video now completed: {video_name}')
-            
-            self.save_progress()
-            
-            print(f'   Completed: {video_name}')
-            return True
-            
-        except Exception as e:
-            error_message = str(e)
-            print(f'   Failed: {video_name} - {error_message}')
+        error_message = _process_single_video(self.config, video_path, use_gpu)
+        return self.record_video_result(video_path, error_message)
+    
+    def record_video_result(self, video_path, error_message=None):
+        """Record a processed video in the progress file; only called in this process."""
+        if error_message is not None:
             self.progress['videos_failed'].append(video_path)
             self.progress['failure_reasons'][video_path] = error_message
             self.save_progress()
             return False
+        
+        self.progress['videos_processed'].append(video_path)
+        
+        # If this video was previously failed, remove it from failed list and failure reasons
+        if video_path in self.progress['videos_failed']:
+            self.progress['videos_failed'].remove(video_path)
+            if video_path in self.progress['failure_reasons']:
+                del self.progress['failure_reasons'][video_path]
+            print(f'   Previously failed video now completed: {os.path.basename(video_path)}')
+        
+        self.save_progress()
+        return True
     
     def run_analysis_parallel(self, max_workers=2, debug_mode=False, use_gpu=False):
         print(f'Running analysis parallel with {max_workers} workers, debug mode: {debug_mode}, GPU: {use_gpu}')
@@ -149,25 +295,79 @@ class RobustPipeline:
             self.progress['start_time'] = datetime.now().isoformat()
             self.save_progress()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_video = {
-                executor.submit(self.process_single_video, video, use_gpu): video 
-                for video in unprocessed
-            }
-            
-            completed = 0
-            total = len(unprocessed)
-            
-            for future in as_completed(future_to_video):
-                video = future_to_video[future]
+        completed = 0
+        total = len(unprocessed)
+        progress_lock = threading.Lock()
+        
+        def finish(video, error_message):
+            nonlocal completed
+            with progress_lock:
+                self.record_video_result(video, error_message)
+                completed += 1
+                print(f'Progress: {completed}/{total} videos completed')
+        
+        # Correlation and clipping run on their own thread, fed as each video
+        # finishes analysis, so encoding overlaps with analyzing the next one
+        clip_queue = queue.Queue(maxsize=2)
+        clip_errors = []  # Exception that stopped the clip thread, re-raised here
+        
+        def clip_worker():
+            try:
+                while True:
+                    item = clip_queue.get()
+                    if item is None:
+                        return
+                    video, video_config = item
+                    finish(video, _correlate_and_clip_video(video_config, video))
+            except BaseException as e:
+                print(f'Clip worker stopped: {e}')
+                clip_errors.append(e)
+        
+        def enqueue(item):
+            # Never block on a full queue once the consumer is gone
+            while clip_thread.is_alive():
                 try:
-                    success = future.result()
-                    completed += 1
-                    print(f'Progress: {completed}/{total} videos completed')
-                except Exception as e:
-                    print(f'Exception processing {video}: {e}')
-                    self.progress['videos_failed'].append(video)
-                    self.save_progress()
+                    clip_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        clip_thread = threading.Thread(target=clip_worker, name='clip-worker')
+        clip_thread.start()
+        
+        try:
+            # Separate processes, so the CPU-bound analysis isn't serialized by
+            # the GIL; spawn gives each worker a clean interpreter and CUDA context
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                future_to_video = {
+                    executor.submit(_analyze_video, self.config, video, use_gpu): video 
+                    for video in unprocessed
+                }
+                
+                for future in as_completed(future_to_video):
+                    video = future_to_video[future]
+                    try:
+                        video_config, error_message = future.result()
+                    except Exception as e:
+                        print(f'Exception processing {video}: {e}')
+                        error_message = str(e)
+                    
+                    if error_message is not None:
+                        finish(video, error_message)
+                    elif not enqueue((video, video_config)):
+                        # The clip thread died; stop instead of analyzing
+                        # videos nobody will clip
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+        finally:
+            enqueue(None)
+            clip_thread.join()
+            self.flush_progress()
+        
+        if clip_errors:
+            raise clip_errors[0]
     
     def run_analysis_sequential(self, debug_mode=False, max_videos=None, use_gpu=False):
         unprocessed = self.get_unprocessed_videos(debug_mode, max_videos)
@@ -184,29 +384,53 @@ class RobustPipeline:
             self.progress['start_time'] = datetime.now().isoformat()
             self.save_progress()
         
-        for i, video in enumerate(unprocessed, 1):
-            print(f'\nProgress: {i}/{len(unprocessed)}')
-            self.process_single_video(video, use_gpu)
+        try:
+            for i, video in enumerate(unprocessed, 1):
+                print(f'\nProgress: {i}/{len(unprocessed)}')
+                self.process_single_video(video, use_gpu)
+        finally:
+            self.flush_progress()
     
     def run_summary(self):
         print('\n--- Running Stage: Summary Generation ---')
         
-        all_events = []
+        events_paths = []
         for video_path in self.progress['videos_processed']:
             video_name = os.path.splitext(os.path.basename(video_path))[0]
             video_data_folder = os.path.join(self.config['data_folder'], 'videos', video_name)
-            events_path = os.path.join(video_data_folder, 'all_events.json')
-            
-            if os.path.exists(events_path):
-                with open(events_path, 'r') as f:
-                    video_events = json.load(f)
-                    all_events.extend(video_events)
+            events_paths.append(os.path.join(video_data_folder, 'all_events.json'))
         
+        # Load the per-video files concurrently so their I/O latency overlaps,
+        # and copy each video's events straight into the combined file instead
+        # of collecting them all in one list first. Only a bounded window of
+        # reads is in flight, consumed in video order, so at most that many
+        # videos' events are held in memory at once.
+        event_count = 0
         combined_events_path = os.path.join(self.config['data_folder'], 'all_events.json')
-        with open(combined_events_path, 'w') as f:
-            json.dump(all_events, f, indent=2)
+        max_workers = min(8, (os.cpu_count() or 1) * 2)
+        window = 2 * max_workers
+        with open(combined_events_path, 'wb') as out, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            out.write(b'[')
+            pending = deque()
+            paths = iter(events_paths)
+            for path in islice(paths, window):
+                pending.append(executor.submit(_read_events_if_exists, path))
+            while pending:
+                events = pending.popleft().result()
+                for path in islice(paths, 1):
+                    pending.append(executor.submit(_read_events_if_exists, path))
+                if events is None:
+                    continue
+                for event in events:
+                    if event_count:
+                        out.write(b',')
+                    out.write(b'\n  ')
+                    out.write(_json_dumps(event))
+                    event_count += 1
+            out.write(b'\n]' if event_count else b']')
         
-        print(f'Combined {len(all_events)} events from all processed videos')
+        print(f'Combined {event_count} events from all processed videos')
         
         print('Running final correlation...')
         correlator.run_correlation(self.config)
@@ -241,7 +465,7 @@ class RobustPipeline:
     def set_rerun_failed(self, enabled=True):
         """Set the rerunFailed flag to control whether to reprocess failed videos"""
         self.progress['rerunFailed'] = enabled
-        self.save_progress()
+        self.save_progress(force=True)
         status = "enabled" if enabled else "disabled"
         print(f'Rerun failed videos: {status}')
     
@@ -256,7 +480,7 @@ class RobustPipeline:
             'start_time': None,
             'last_update': None
         }
-        self.save_progress()
+        self.save_progress(force=True)
         print('Progress reset successfully')
 
 def main():
@@ -277,9 +501,7 @@ def main():
                         help='Disable rerunning of previously failed videos')
     args = parser.parse_args()
 
-    os.makedirs('./data', exist_ok=True)
-    os.makedirs('./final_clips', exist_ok=True)
-    os.makedirs('./data/videos', exist_ok=True)
+    ensure_dirs(('./data', './final_clips', './data/videos'))
 
     pipeline = RobustPipeline(args.config)
     
@@ -1,8 +1,8 @@
 # === FILE: main.py ===
 import argparse
 import yaml
-import os
 from chaos_lib import ingestion, analyzers, correlator, clipper, summary
+from chaos_lib.utils import ensure_dirs
 
 def main():
     parser = argparse.ArgumentParser(description="CHAOS: CS2 Highlight Analysis & Organization System")
@@ -25,8 +25,7 @@ def main():
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!\n")
 
     # Ensure output directories exist
-    os.makedirs(config['data_folder'], exist_ok=True)
-    os.makedirs(config['final_clips_folder'], exist_ok=True)
+    ensure_dirs((config['data_folder'], config['final_clips_folder']))
 
     if args.stage in ['all', 'ingest']:
         print("\n--- Running Stage: Ingestion ---")
@@ -2,10 +2,51 @@ import cv2
 import numpy as np
 import yaml
 import argparse
+import os
 # Import the ROI scaling function and icon detection from analyzers
 from chaos_lib.analyzers import scale_roi_for_resolution, _detect_headshot_icon, _detect_smoke_icon
 
-def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'config.yaml'):
+def _find_icon_boxes(killfeed_crop):
+    """Find headshot and smoke icon candidates across the whole killfeed crop.
+    
+    Uses the same gray ranges and size filters as the icon detectors, so the
+    boxes can be matched to each kill afterwards instead of re-running the
+    search inside every kill region.
+    """
+    gray = cv2.cvtColor(killfeed_crop, cv2.COLOR_BGR2GRAY)
+    
+    headshot_boxes = []
+    white_mask = cv2.inRange(gray, 220, 255)
+    icon_contours, _ = cv2.findContours(white_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    for icon_cnt in icon_contours:
+        if 30 < cv2.contourArea(icon_cnt) < 300:
+            headshot_boxes.append(cv2.boundingRect(icon_cnt))
+    
+    smoke_boxes = []
+    smoke_mask = cv2.inRange(gray, 120, 200)  # Medium gray, not bright white
+    icon_contours, _ = cv2.findContours(smoke_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    for icon_cnt in icon_contours:
+        if 40 < cv2.contourArea(icon_cnt) < 150:  # Same size range as detection
+            icon_x, icon_y, icon_w, icon_h = cv2.boundingRect(icon_cnt)
+            icon_aspect = icon_w / icon_h if icon_h > 0 else 0
+            if 0.7 < icon_aspect < 1.4:  # Same aspect ratio as detection
+                smoke_boxes.append((icon_x, icon_y, icon_w, icon_h))
+    
+    return headshot_boxes, smoke_boxes
+
+def _boxes_within(boxes, x, y, w, h):
+    """Yield the boxes lying entirely inside the rectangle (x, y, w, h)."""
+    for box in boxes:
+        bx, by, bw, bh = box
+        if x <= bx and y <= by and bx + bw <= x + w and by + bh <= y + h:
+            yield box
+
+def _label(image, text, org, color, scale=0.4):
+    """Draw a one-pixel annotation label with the 4-connected line rasterizer."""
+    cv2.putText(image, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, 1, cv2.LINE_4)
+
+def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'config.yaml',
+                        use_opencl: bool = False):
     print("--- CHAOS Kill Detection Tuner ---")
     print("Controls:")
     print("  'd' / Right Arrow -> Next Frame (+1)")
@@ -22,6 +63,8 @@ def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'co
     # Load the initial config
     with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
+    config_mtime = os.stat(config_path).st_mtime_ns
+    params = None  # Tuning parameters parsed from config, rebuilt on reload
 
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
@@ -32,6 +75,15 @@ def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'co
     video_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     video_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     print(f"Video resolution: {video_width}x{video_height}")
+    
+    # Optionally run the per-pixel mask work through OpenCV's OpenCL T-API
+    if use_opencl:
+        if cv2.ocl.haveOpenCL():
+            cv2.ocl.setUseOpenCL(True)
+            print("Using OpenCL for the red mask.")
+        else:
+            print("Warning: OpenCL is not available. Using the CPU path.")
+            use_opencl = False
         
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     fps = cap.get(cv2.CAP_PROP_FPS)
@@ -40,48 +92,100 @@ def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'co
         fps = 30
 
     frame_idx = int(start_time * fps)
+    next_pos = -1  # Frame index the next cap.read() returns; -1 if unknown
+    last_idx = None  # Frame index of the decoded frame in `frame`
+    frame = None
+    crop_key = None  # (frame_idx, ROI) the cached crop and HSV image belong to
+    killfeed_crop = hsv = None
+    red_mask = mask2 = None
+    contours_visualization = None  # Annotation canvas, redrawn from the crop
+    icon_boxes = None  # (headshot, smoke) icon boxes in the cached crop
+    display_buf = np.empty((540, 960, 3), np.uint8)  # Downscaled full frame
 
     while 0 <= frame_idx < total_frames:
-        # Set the frame position
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, frame = cap.read()
-        if not ret:
-            print("End of video.")
-            break
+        # Only decode when the frame changed; any other key just redraws the
+        # same frame with the current config
+        if frame_idx != last_idx:
+            skip = frame_idx - next_pos
+            if next_pos < 0 or not 0 <= skip <= int(fps):
+                # Backwards or far jump: seek (decodes from the nearest keyframe)
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            else:
+                # Short step forward: grab() skips frames without retrieving them
+                for _ in range(skip):
+                    if not cap.grab():
+                        break
+            ret, frame = cap.read()
+            if not ret:
+                print("End of video.")
+                break
+            last_idx = frame_idx
+            next_pos = frame_idx + 1
 
-        # --- Reload config on every frame to get live updates ---
+        # --- Reload config when the file changed to get live updates ---
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            mtime = os.stat(config_path).st_mtime_ns
+            if mtime != config_mtime:
+                with open(config_path, 'r') as f:
+                    config = yaml.safe_load(f)
+                config_mtime = mtime
+                params = None
         except Exception as e:
             print(f"Error reading config.yaml: {e}")
             pass # Keep using old config if file is malformed
 
-        # Get parameters from config
-        hsv_lower1 = np.array(config['red_hsv_lower1'])
-        hsv_upper1 = np.array(config['red_hsv_upper1'])
-        hsv_lower2 = np.array(config['red_hsv_lower2'])
-        hsv_upper2 = np.array(config['red_hsv_upper2'])
-        min_h = config['killfeed_rect_min_height']
-        max_h = config['killfeed_rect_max_height']
-        min_aspect_ratio = config['killfeed_rect_min_aspect_ratio']
-        roi_coords = config['killfeed_roi']
-        x1, y1, x2, y2 = scale_roi_for_resolution(roi_coords, video_width, video_height)
+        # Get parameters from config; the bound arrays are only rebuilt
+        # when the config was reloaded
+        if params is None:
+            params = (
+                np.asarray(config['red_hsv_lower1'], dtype=np.uint8),
+                np.asarray(config['red_hsv_upper1'], dtype=np.uint8),
+                np.asarray(config['red_hsv_lower2'], dtype=np.uint8),
+                np.asarray(config['red_hsv_upper2'], dtype=np.uint8),
+                config['killfeed_rect_min_height'],
+                config['killfeed_rect_max_height'],
+                config['killfeed_rect_min_aspect_ratio'],
+                scale_roi_for_resolution(config['killfeed_roi'], video_width, video_height),
+            )
+        (hsv_lower1, hsv_upper1, hsv_lower2, hsv_upper2,
+         min_h, max_h, min_aspect_ratio, (x1, y1, x2, y2)) = params
+        
+        # Threshold edits redraw the same frame; only a new frame or ROI
+        # needs the crop converted to HSV again
+        if crop_key != (frame_idx, x1, y1, x2, y2):
+            killfeed_crop = frame[y1:y2, x1:x2]
+            hsv = cv2.cvtColor(cv2.UMat(killfeed_crop) if use_opencl else killfeed_crop,
+                               cv2.COLOR_BGR2HSV)
+            crop_key = (frame_idx, x1, y1, x2, y2)
+            icon_boxes = None
+            if contours_visualization is None or contours_visualization.shape != killfeed_crop.shape:
+                contours_visualization = np.empty_like(killfeed_crop)
+            # Mask buffers sized to the crop, reused by every redraw
+            if not use_opencl and (red_mask is None or red_mask.shape != killfeed_crop.shape[:2]):
+                red_mask = np.empty(killfeed_crop.shape[:2], np.uint8)
+                mask2 = np.empty_like(red_mask)
         
-        killfeed_crop = frame[y1:y2, x1:x2]
-        hsv = cv2.cvtColor(killfeed_crop, cv2.COLOR_BGR2HSV)
-        mask1 = cv2.inRange(hsv, hsv_lower1, hsv_upper1)
-        mask2 = cv2.inRange(hsv, hsv_lower2, hsv_upper2)
-        red_mask = cv2.bitwise_or(mask1, mask2)
+        if use_opencl:
+            # The HSV image stays on the device; only the final mask is
+            # downloaded for findContours
+            red_mask = cv2.bitwise_or(cv2.inRange(hsv, hsv_lower1, hsv_upper1),
+                                      cv2.inRange(hsv, hsv_lower2, hsv_upper2)).get()
+        else:
+            # Both hue bands are written into preallocated masks and OR'd in
+            # place, so no intermediate masks are allocated
+            cv2.inRange(hsv, hsv_lower1, hsv_upper1, dst=red_mask)
+            cv2.inRange(hsv, hsv_lower2, hsv_upper2, dst=mask2)
+            cv2.bitwise_or(red_mask, mask2, dst=red_mask)
         
         contours, _ = cv2.findContours(red_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
-        contours_visualization = killfeed_crop.copy()
+        np.copyto(contours_visualization, killfeed_crop)
         
         current_time_sec = frame_idx / fps
-        print(f"\n--- Frame {frame_idx} (Time: {current_time_sec:.2f}s) ---")
+        # The report is collected and printed in one write per frame
+        report = [f"\n--- Frame {frame_idx} (Time: {current_time_sec:.2f}s) ---"]
         if not contours:
-            print("No red contours detected.")
+            report.append("No red contours detected.")
             
         for i, cnt in enumerate(contours):
             x, y, w, h = cv2.boundingRect(cnt)
@@ -91,16 +195,20 @@ def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'co
             aspect_ok = aspect_ratio >= min_aspect_ratio
             is_valid_kill = height_ok and aspect_ok
             
-            # Check for special kill types
-            kill_region = killfeed_crop[y:y+h, x:x+w]
-            is_headshot = _detect_headshot_icon(kill_region)
-            through_smoke = _detect_smoke_icon(kill_region)
+            # Check for special kill types; like the analyzer, only on entries
+            # that pass the shape filter, so noise blobs skip icon detection
+            if is_valid_kill:
+                kill_region = killfeed_crop[y:y+h, x:x+w]
+                is_headshot = _detect_headshot_icon(kill_region)
+                through_smoke = _detect_smoke_icon(kill_region)
+            else:
+                is_headshot = through_smoke = False
             
-            print(f"Contour #{i}: Pos=({x},{y}) Size=({w}x{h}) Height OK? {height_ok} | Aspect Ratio={aspect_ratio:.2f} OK? {aspect_ok}")
+            report.append(f"Contour #{i}: Pos=({x},{y}) Size=({w}x{h}) Height OK? {height_ok} | Aspect Ratio={aspect_ratio:.2f} OK? {aspect_ok}")
             if is_headshot:
-                print(f"  -> HEADSHOT DETECTED!")
+                report.append("  -> HEADSHOT DETECTED!")
             if through_smoke:
-                print(f"  -> SMOKE KILL DETECTED!")
+                report.append("  -> SMOKE KILL DETECTED!")
 
             # Color coding: Green=valid, Red=invalid, Blue=headshot, Orange=smoke
             if is_headshot:
@@ -114,57 +222,46 @@ def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'co
                 
             # Draw main kill rectangle
             cv2.rectangle(contours_visualization, (x, y), (x + w, y + h), color, 2)
-            cv2.putText(contours_visualization, f"H:{h}", (x, y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
-            cv2.putText(contours_visualization, f"AR:{aspect_ratio:.1f}", (x, y + h + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
+            _label(contours_visualization, f"H:{h}", (x, y - 5), color)
+            _label(contours_visualization, f"AR:{aspect_ratio:.1f}", (x, y + h + 15), color)
             
             # Draw individual icon detection rectangles
             if is_headshot or through_smoke:
-                # Find and highlight the specific icon that was detected
-                gray = cv2.cvtColor(kill_region, cv2.COLOR_BGR2GRAY)
+                # Icon candidates are found once per crop, then matched to
+                # each kill by bounding box
+                if icon_boxes is None:
+                    icon_boxes = _find_icon_boxes(killfeed_crop)
+                headshot_boxes, smoke_boxes = icon_boxes
                 if is_headshot:
-                    # Look for headshot icon specifically
-                    white_mask = cv2.inRange(gray, 220, 255)
-                    icon_contours, _ = cv2.findContours(white_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                    for icon_cnt in icon_contours:
-                        icon_area = cv2.contourArea(icon_cnt)
-                        if 30 < icon_area < 300:
-                            icon_x, icon_y, icon_w, icon_h = cv2.boundingRect(icon_cnt)
-                            # Draw blue rectangle around the detected headshot icon
-                            cv2.rectangle(contours_visualization, 
-                                        (x + icon_x, y + icon_y), 
-                                        (x + icon_x + icon_w, y + icon_y + icon_h), 
-                                        (255, 0, 0), 3)  # Bright blue for headshot icon
-                            cv2.putText(contours_visualization, "HS", 
-                                      (x + icon_x, y + icon_y - 5), 
-                                      cv2.FONT_HERSHEY_SIMPLEX, 0.3, (255, 0, 0), 1)
+                    for icon_x, icon_y, icon_w, icon_h in _boxes_within(headshot_boxes, x, y, w, h):
+                        # Draw blue rectangle around the detected headshot icon
+                        cv2.rectangle(contours_visualization, 
+                                    (icon_x, icon_y), 
+                                    (icon_x + icon_w, icon_y + icon_h), 
+                                    (255, 0, 0), 3)  # Bright blue for headshot icon
+                        _label(contours_visualization, "HS", (icon_x, icon_y - 5), (255, 0, 0), 0.3)
                 
                 if through_smoke:
-                    # Look for smoke icon specifically - use same logic as detection
-                    smoke_mask = cv2.inRange(gray, 120, 200)  # Medium gray, not bright white
-                    icon_contours, _ = cv2.findContours(smoke_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                    for icon_cnt in icon_contours:
-                        icon_area = cv2.contourArea(icon_cnt)
-                        if 40 < icon_area < 150:  # Same size range as detection
-                            icon_x, icon_y, icon_w, icon_h = cv2.boundingRect(icon_cnt)
-                            icon_aspect = icon_w / icon_h if icon_h > 0 else 0
-                            if 0.7 < icon_aspect < 1.4:  # Same aspect ratio as detection
-                                # Draw orange rectangle around the detected smoke icon
-                                cv2.rectangle(contours_visualization, 
-                                            (x + icon_x, y + icon_y), 
-                                            (x + icon_x + icon_w, y + icon_y + icon_h), 
-                                            (0, 165, 255), 3)  # Orange for smoke icon
-                                cv2.putText(contours_visualization, "SM", 
-                                          (x + icon_x, y + icon_y - 5), 
-                                          cv2.FONT_HERSHEY_SIMPLEX, 0.3, (0, 165, 255), 1)
+                    for icon_x, icon_y, icon_w, icon_h in _boxes_within(smoke_boxes, x, y, w, h):
+                        # Draw orange rectangle around the detected smoke icon
+                        cv2.rectangle(contours_visualization, 
+                                    (icon_x, icon_y), 
+                                    (icon_x + icon_w, icon_y + icon_h), 
+                                    (0, 165, 255), 3)  # Orange for smoke icon
+                        _label(contours_visualization, "SM", (icon_x, icon_y - 5), (0, 165, 255), 0.3)
             
             # Add special labels
             if is_headshot:
-                cv2.putText(contours_visualization, "HEADSHOT", (x, y + h + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
+                _label(contours_visualization, "HEADSHOT", (x, y + h + 30), color)
             if through_smoke:
-                cv2.putText(contours_visualization, "SMOKE", (x, y + h + 45), cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
+                _label(contours_visualization, "SMOKE", (x, y + h + 45), color)
 
+        print("\n".join(report))
+        
         # Display the windows
-        cv2.imshow("Original Full Frame (press 'j' to jump)", cv2.resize(frame, (960, 540)))
+        # Area averaging is the fast, alias-free path for downscaling
+        cv2.resize(frame, (960, 540), dst=display_buf, interpolation=cv2.INTER_AREA)
+        cv2.imshow("Original Full Frame (press 'j' to jump)", display_buf)
         cv2.imshow("Killfeed ROI", killfeed_crop)
         cv2.imshow("Red Mask", red_mask)
         cv2.imshow("Contours (Green=Valid, Red=Invalid, Blue=Headshot, Orange=Smoke)", contours_visualization)
@@ -186,7 +283,16 @@ def tune_kill_detection(video_path: str, start_time: int, config_path: str = 'co
                 # Close windows temporarily to allow input
                 cv2.destroyAllWindows()
                 jump_sec = float(input("Enter time in seconds to jump to: "))
-                frame_idx = int(jump_sec * fps)
+                # A time-based seek lets the backend land on the nearest
+                # keyframe instead of counting to an exact frame, so the
+                # jump may land slightly off the requested second
+                cap.set(cv2.CAP_PROP_POS_MSEC, jump_sec * 1000.0)
+                landed = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+                if landed >= 0:
+                    frame_idx = next_pos = landed
+                else:
+                    frame_idx = int(jump_sec * fps)
+                    next_pos = -1
             except ValueError:
                 print("Invalid input. Please enter a number.")
                 # Re-show the windows if input fails
@@ -199,5 +305,6 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Visual tuner for CHAOS kill detection.")
     parser.add_argument('--video', required=True, help="Path to the video file to analyze.")
     parser.add_argument('--start-time', type=int, default=0, help="Optional time in seconds to start the analysis from.")
+    parser.add_argument('--opencl', action='store_true', help="Build the red mask with OpenCL when a device is available.")
     args = parser.parse_args()
-    tune_kill_detection(args.video, args.start_time)
\ No newline at end of file
+    tune_kill_detection(args.video, args.start_time, use_opencl=args.opencl)
\ No newline at end of file